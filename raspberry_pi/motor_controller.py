@@ -13,6 +13,7 @@ Features:
 
 import time
 import json
+import math
 import argparse
 import signal
 import sys
@@ -21,9 +22,46 @@ import threading
 import can
 import logging
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# JSON-Parser für Sensor-Hub-Nachrichten: orjson (C) wenn installiert, sonst stdlib.
+# Beide akzeptieren bytes direkt, das UTF-8-Decode übernimmt der Parser.
+_json_loads = orjson.loads if ORJSON_AVAILABLE else json.loads
+
+# Multi-Frame-Reassembly: max. 255 Frames à 6 Bytes Nutzdaten. Die Null-Vorlage
+# wird einmal angelegt, Slices davon kopieren ohne neue Allokation.
+_CAN_MAX_PAYLOAD = 255 * 6
+_CAN_ZEROS = memoryview(bytes(_CAN_MAX_PAYLOAD))
+
 # Flask/SocketIO imports werden nur bei Bedarf geladen (siehe _init_web_interface)
 
+
+class _SensorHubListener(can.Listener):
+    """Notifier-Listener: reicht Frames weiter und meldet Empfangsfehler"""
+
+    def __init__(self, controller):
+        self._controller = controller
+
+    def on_message_received(self, msg):
+        self._controller._on_can_message(msg)
+
+    def on_error(self, exc):
+        # Ohne on_error wirft der Notifier-Thread die Exception weiter und
+        # endet - der Sensor-Hub-Empfang käme nie wieder
+        self._controller._on_can_error(exc)
+
+
 class MotorController:
+    # Hardware-PWM Duty (0-1000000) für 1000-2000μs bei 50Hz: μs * 1000000 / 20000
+    _DUTY_TABLE = tuple(us * 50 for us in range(1000, 2001))
+    # Skid-Steering-Verstärkung: Vollausschlag in μs um Neutral (1500μs)
+    _SKID_FORWARD_US = 500
+    _SKID_TURN_US = 300
+
     def __init__(self, enable_pwm=False, pwm_pins=[18, 19], enable_monitor=True, quiet=False,
                  enable_ramping=True, acceleration_rate=25, deceleration_rate=800, brake_rate=1500,
                  enable_web=False, web_port=80, safety_pin=17, light_enabled=True, light_pin=22,
@@ -56,6 +94,8 @@ class MotorController:
         self.enable_monitor = enable_monitor
         self.quiet = quiet
         self.pwm_pins = {'left': pwm_pins[1], 'right': pwm_pins[0]}  # Links=GPIO19, Rechts=GPIO18
+        self.pwm_pin_left = self.pwm_pins['left']
+        self.pwm_pin_right = self.pwm_pins['right']
         
         # Sicherheitsschaltleiste
         self.safety_pin = safety_pin
@@ -85,7 +125,12 @@ class MotorController:
         self.web_thread = None
         self.flask_app = None
         
-        # PWM-Objekte
+        # PWM-Objekte (pigpio-Handle wird in _init_pwm gesetzt)
+        self.gpio = None
+        self.pi = None
+        self._gpio_output = None  # GPIO.output, gebunden in _init_light/_init_mower
+        self._gpio_high = 1
+        self._gpio_low = 0
         self.pwm_objects = {}
         self.last_pwm_values = {'left': 1500, 'right': 1500}
         
@@ -96,10 +141,10 @@ class MotorController:
         self.brake_rate = brake_rate
         self.current_pwm_values = {'left': 1500, 'right': 1500}
         self.target_pwm_values = {'left': 1500, 'right': 1500}
-        self.last_ramping_time = time.time()
+        self.last_ramping_time = time.monotonic()
         
         # Sicherheit
-        self.last_command_time = time.time()
+        self.last_command_time = time.monotonic()
         self.command_timeout = 2.0
         
         # Joystick-Steuerung
@@ -114,9 +159,12 @@ class MotorController:
         self.can_interface = can_interface
         self.can_bitrate = can_bitrate
         self.can_bus = None
-        self.can_reader_thread = None
+        self.can_notifier = None
+        self._can_error_count = 0  # Aufeinanderfolgende Empfangsfehler (Backoff)
+        self._can_restart_pending = False
         self.sensor_data = {}  # Letzte Sensor-Daten vom Sensor Hub
         self.can_frame_buffer = {}  # Buffer für Multi-Frame Nachrichten
+        self._can_frame_data = bytearray(_CAN_MAX_PAYLOAD)  # Nutzdaten (max. 255 Frames à 6 Bytes)
         
         # Initialisierungen
         if self.enable_pwm:
@@ -147,9 +195,15 @@ class MotorController:
             if not self.pi.connected:
                 raise Exception("pigpio daemon nicht erreichbar")
             
+            # Neutral-Befehle für den Notaus vorberechnen (Pin, 50Hz, 1500μs)
+            self._neutral_left = (self.pwm_pin_left, 50, self._DUTY_TABLE[500])
+            self._neutral_right = (self.pwm_pin_right, 50, self._DUTY_TABLE[500])
+            
             # GPIO-Pins als PWM konfigurieren
             for side, pin in self.pwm_pins.items():
-                self.pi.hardware_PWM(pin, 50, 1500 * 1000)  # 50Hz, 1500μs (neutral)
+                self.pi.hardware_PWM(pin, 50, self._DUTY_TABLE[500])  # 50Hz, 1500μs (neutral)
+            
+            atexit.register(self._cleanup_pwm)
             
             if not self.quiet:
                 print(f"✅ Hardware-PWM initialisiert: Links={self.pwm_pins['left']}, Rechts={self.pwm_pins['right']}")
@@ -158,6 +212,18 @@ class MotorController:
             print(f"❌ PWM-Initialisierung Fehler: {e}")
             self.enable_pwm = False
     
+    def _cleanup_pwm(self):
+        """Setzt Motoren auf Neutral und gibt das pigpio-Handle frei"""
+        if self.pi is None:
+            return
+        try:
+            for pin in self.pwm_pins.values():
+                self.pi.hardware_PWM(pin, 50, self._DUTY_TABLE[500])
+            self.pi.stop()
+        except Exception:
+            pass
+        self.pi = None
+    
     def _init_light(self):
         """Initialisiert Licht-Relais"""
         try:
@@ -165,6 +231,7 @@ class MotorController:
             GPIO.setmode(GPIO.BCM)
             GPIO.setup(self.light_pin, GPIO.OUT)
             GPIO.output(self.light_pin, GPIO.LOW)
+            self._bind_gpio_output(GPIO)
             if not self.quiet:
                 print(f"✅ Licht-Relais initialisiert (GPIO{self.light_pin})")
         except Exception as e:
@@ -178,12 +245,19 @@ class MotorController:
             GPIO.setmode(GPIO.BCM)
             GPIO.setup(self.mower_relay_pin, GPIO.OUT)
             GPIO.output(self.mower_relay_pin, GPIO.LOW)
+            self._bind_gpio_output(GPIO)
             if not self.quiet:
                 print(f"✅ Mäher-Steuerung initialisiert (Relais GPIO{self.mower_relay_pin}, PWM GPIO{self.mower_pwm_pin})")
         except Exception as e:
             print(f"❌ Mäher-Initialisierung Fehler: {e}")
             self.mower_enabled = False
     
+    def _bind_gpio_output(self, GPIO):
+        """Bindet GPIO.output und Pegel einmalig für die Relais-Setter"""
+        self._gpio_output = GPIO.output
+        self._gpio_high = GPIO.HIGH
+        self._gpio_low = GPIO.LOW
+    
     def _init_safety_switch(self):
         """Initialisiert Sicherheitsschalter"""
         try:
@@ -199,7 +273,7 @@ class MotorController:
     
     def _safety_callback(self, channel):
         """Callback für Sicherheitsschalter"""
-        current_time = time.time()
+        current_time = time.monotonic()
         if current_time - self.last_safety_trigger < 0.5:
             return
         
@@ -213,12 +287,14 @@ class MotorController:
     def _init_can_bus(self):
         """Initialisiert CAN-Bus für JSON-Kommunikation"""
         try:
+            # Kernel-Filter: nur Frames des Sensor Hubs (0x100) erreichen Python
             self.can_bus = can.interface.Bus(channel=self.can_interface,
-                                             interface='socketcan')
+                                             interface='socketcan',
+                                             can_filters=[{'can_id': 0x100, 'can_mask': 0x7FF, 'extended': False}])
                                              # bitrate nicht angeben, da CAN bereits via ip link konfiguriert ist
             
-            self.can_reader_thread = threading.Thread(target=self._can_reader_loop, daemon=True)
-            self.can_reader_thread.start()
+            # Notifier ruft den Handler auf, sobald ein Frame anliegt
+            self.can_notifier = can.Notifier(self.can_bus, [_SensorHubListener(self)], timeout=1.0)
             
             if not self.quiet:
                 print(f"✅ CAN-Bus initialisiert ({self.can_interface}, {self.can_bitrate} bps)")
@@ -227,67 +303,115 @@ class MotorController:
             print(f"❌ CAN-Bus Initialisierung Fehler: {e}")
             self.can_bus = None
     
-    def _can_reader_loop(self):
-        """Liest CAN-Nachrichten und verarbeitet JSON (Multi-Frame Support)"""
-        while True:
+    def _on_can_error(self, exc):
+        """Empfangsfehler im Notifier-Thread (z.B. can0 down): Bus neu aufbauen
+
+        Je nach python-can-Version endet der Notifier-Thread nach on_error oder
+        ruft recv() sofort erneut auf. Der Neuaufbau deckt beide Fälle ab, die
+        Wartezeit hier verhindert eine Fehlerschleife bis dahin.
+        """
+        self._can_error_count += 1
+        delay = min(0.1 * (1 << min(self._can_error_count, 5)), 2.0)
+        if not self.quiet:
+            print(f"⚠️ CAN-Empfangsfehler: {exc} - Neuaufbau in {delay:.1f}s")
+        self._schedule_can_restart(delay)
+        time.sleep(delay)
+
+    def _schedule_can_restart(self, delay):
+        """Plant einen (einzigen) verzögerten Neuaufbau von Bus und Notifier"""
+        if self._can_restart_pending:
+            return
+        self._can_restart_pending = True
+        timer = threading.Timer(delay, self._restart_can_bus)
+        timer.daemon = True
+        timer.start()
+
+    def _restart_can_bus(self):
+        """Stoppt Notifier und Bus und initialisiert beide neu"""
+        notifier, bus = self.can_notifier, self.can_bus
+        self.can_notifier = None
+        self.can_bus = None
+        # stop() wartet auf den Notifier-Thread, erst danach den Bus schließen
+        if notifier is not None:
+            try:
+                notifier.stop(timeout=5.0)
+            except Exception:
+                pass
+        if bus is not None:
             try:
-                if not self.can_bus:
-                    time.sleep(0.1)
-                    continue
-
-                msg = self.can_bus.recv(timeout=1.0)
-                if msg is None:
-                    continue
-
-                # Multi-Frame Nachricht verarbeiten
-                if msg.arbitration_id == 0x100:  # Sensor Hub ID
-                    json_str = self._process_can_multiframe(msg)
-                    if json_str:
-                        try:
-                            data = json.loads(json_str)
-                            self._process_sensor_data(data)
-                        except Exception as e:
-                            if not self.quiet:
-                                print(f"⚠️ JSON-Decode Fehler: {e}")
-                else:
-                    # Andere CAN-IDs ignorieren oder anders verarbeiten
-                    pass
+                bus.shutdown()
+            except Exception:
+                pass
 
-            except Exception as e:
-                if not self.quiet:
-                    print(f"⚠️ CAN-Reader Fehler: {e}")
-                time.sleep(0.1)
+        self._can_restart_pending = False
+        self._init_can_bus()
+        if self.can_bus is None:
+            # Interface noch nicht wieder da: mit wachsendem Abstand erneut versuchen
+            self._can_error_count += 1
+            self._schedule_can_restart(min(0.1 * (1 << min(self._can_error_count, 5)), 2.0))
+
+    def _on_can_message(self, msg):
+        """Verarbeitet eine CAN-Nachricht vom Sensor Hub (Multi-Frame JSON)"""
+        if self._can_error_count:
+            self._can_error_count = 0
+        # Exceptions dürfen den Notifier-Thread nicht beenden
+        try:
+            payload = self._process_can_multiframe(msg)
+            if payload:
+                try:
+                    data = _json_loads(payload)
+                    self._process_sensor_data(data)
+                except Exception as e:
+                    if not self.quiet:
+                        print(f"⚠️ JSON-Decode Fehler: {e}")
+
+        except Exception as e:
+            if not self.quiet:
+                print(f"⚠️ CAN-Reader Fehler: {e}")
 
     def _process_can_multiframe(self, msg):
-        """Verarbeitet Multi-Frame CAN-Nachrichten (6 Bytes Nutzdaten pro Frame)"""
-        if len(msg.data) < 2:
+        """Verarbeitet Multi-Frame CAN-Nachrichten (6 Bytes Nutzdaten pro Frame)
+
+        Returns:
+            Vollständige JSON-Nutzdaten als bytes, sonst None
+        """
+        data = msg.data
+        if len(data) < 2:
             return None
 
-        frame_idx = msg.data[0]
-        total_frames = msg.data[1]
-        chunk = msg.data[2:8]  # Max 6 Bytes Nutzdaten
+        frame_idx = data[0]
+        total_frames = data[1]
 
-        # Ersten Frame: Buffer initialisieren
+        # Ersten Frame: Buffer initialisieren (Nutzdaten liegen im vorallokierten
+        # bytearray, pro Nachricht wird nur der benötigte Bereich genullt)
         if frame_idx == 0:
+            self._can_frame_data[:total_frames * 6] = _CAN_ZEROS[:total_frames * 6]
             self.can_frame_buffer = {
                 'total': total_frames,
-                'frames': [None] * total_frames,
-                'timestamp': time.time()
+                'complete_mask': (1 << total_frames) - 1,
+                'received_mask': 0,
+                'timestamp': time.monotonic()
             }
 
-        # Frame im Buffer speichern
-        if 'frames' in self.can_frame_buffer and frame_idx < len(self.can_frame_buffer['frames']):
-            self.can_frame_buffer['frames'][frame_idx] = chunk
+        buffer = self.can_frame_buffer
+        if not buffer:
+            # Folge-Frame ohne Start-Frame
+            return None
 
-        # Prüfen ob alle Frames empfangen
-        if all(f is not None for f in self.can_frame_buffer.get('frames', [])):
-            # Alle Frames zusammensetzen
-            full_data = b''.join(self.can_frame_buffer['frames'])
+        # Frame direkt an seine Position im Buffer schreiben
+        if frame_idx < buffer['total']:
+            offset = frame_idx * 6
+            chunk = data[2:8]  # Max 6 Bytes Nutzdaten
+            self._can_frame_data[offset:offset + len(chunk)] = chunk
+            buffer['received_mask'] |= 1 << frame_idx
+
+        # Prüfen ob alle Frames empfangen (ein Bit pro Frame)
+        if buffer['received_mask'] == buffer['complete_mask']:
             # Null-Bytes entfernen
-            full_data = full_data.rstrip(b'\x00')
+            full_data = bytes(self._can_frame_data[:buffer['total'] * 6].rstrip(b'\x00'))
             # Buffer leeren
             self.can_frame_buffer = {}
-            return full_data.decode('utf-8')
+            return full_data
 
         return None
     
@@ -370,10 +494,26 @@ class MotorController:
         @self.flask_app.route('/api/joystick', methods=['POST'])
         def api_joystick():
             if not self.can_enabled:
-                data = request.get_json()
-                self.joystick_x = data.get('x', 0.0)
-                self.joystick_y = data.get('y', 0.0)
-                self.joystick_last_update = time.time()
+                # Query-Parameter (?x=..&y=..) sparen das JSON-Parsing pro Update,
+                # ein JSON-Body wird für bestehende Clients weiter akzeptiert
+                args = request.args
+                try:
+                    if 'x' in args or 'y' in args:
+                        x = float(args.get('x', 0.0))
+                        y = float(args.get('y', 0.0))
+                    else:
+                        data = request.get_json(silent=True) or {}
+                        x = float(data.get('x', 0.0))
+                        y = float(data.get('y', 0.0))
+                except (TypeError, ValueError):
+                    return jsonify({'success': False, 'error': 'x/y müssen Zahlen sein'}), 400
+                # float() akzeptiert 'nan'/'inf' - diese würden erst bei der
+                # Festkomma-Wandlung mit ValueError/OverflowError scheitern
+                if not (math.isfinite(x) and math.isfinite(y)):
+                    return jsonify({'success': False, 'error': 'x/y müssen endlich sein'}), 400
+                self.joystick_x = x
+                self.joystick_y = y
+                self.joystick_last_update = time.monotonic()
                 self.joystick_enabled = True
                 self._process_joystick_input(self.joystick_x, self.joystick_y)
             return jsonify({'success': True})
@@ -397,39 +537,49 @@ class MotorController:
     
     def _emergency_stop(self):
         """Notaus - Motoren auf Neutral"""
-        self._set_motor_pwm('left', 1500)
-        self._set_motor_pwm('right', 1500)
+        # Vorberechnete Neutral-Befehle direkt an pigpio, unabhängig vom CAN-Status
+        if self.enable_pwm and self.pi is not None:
+            try:
+                self.pi.hardware_PWM(*self._neutral_left)
+                self.pi.hardware_PWM(*self._neutral_right)
+                self.current_pwm_values['left'] = 1500
+                self.current_pwm_values['right'] = 1500
+            except Exception as e:
+                print(f"❌ NOTAUS PWM-Fehler: {e}")
         self.joystick_enabled = False
         if not self.quiet:
             print("🛑 NOTAUS aktiviert - Motoren neutral")
     
-    def _set_motor_pwm(self, side, pwm_value):
-        """Setzt Motor-PWM"""
-        if not self.enable_pwm or not self.can_bus:
+    def _set_motors_direct(self, left_pwm, right_pwm):
+        """Setzt Motor-PWM für beide Seiten in einem Durchgang"""
+        if not self.enable_pwm or not self.can_bus or self.pi is None:
             return
         
         try:
-            import pigpio
-            pi = pigpio.pi()
-            pin = self.pwm_pins[side]
-            pi.hardware_PWM(pin, 50, pwm_value * 1000)
-            self.current_pwm_values[side] = pwm_value
+            left_pwm = max(1000, min(2000, int(left_pwm)))
+            right_pwm = max(1000, min(2000, int(right_pwm)))
+            self.pi.hardware_PWM(self.pwm_pin_left, 50, self._DUTY_TABLE[left_pwm - 1000])
+            self.pi.hardware_PWM(self.pwm_pin_right, 50, self._DUTY_TABLE[right_pwm - 1000])
+            self.current_pwm_values['left'] = left_pwm
+            self.current_pwm_values['right'] = right_pwm
         except:
             pass
     
     def _set_light(self, state):
         """Setzt Licht-Relais"""
+        if self._gpio_output is None:
+            return
         try:
-            import RPi.GPIO as GPIO
-            GPIO.output(self.light_pin, GPIO.HIGH if state else GPIO.LOW)
+            self._gpio_output(self.light_pin, self._gpio_high if state else self._gpio_low)
         except:
             pass
     
     def _set_mower(self, state):
         """Setzt Mäher-Relais"""
+        if self._gpio_output is None:
+            return
         try:
-            import RPi.GPIO as GPIO
-            GPIO.output(self.mower_relay_pin, GPIO.HIGH if state else GPIO.LOW)
+            self._gpio_output(self.mower_relay_pin, self._gpio_high if state else self._gpio_low)
         except:
             pass
     
@@ -442,16 +592,27 @@ class MotorController:
         if not self.enable_pwm or self.can_enabled:
             return
 
+        # Stick-Werte einmal in Festkomma (1/1024) wandeln, danach nur noch
+        # Integer-Arithmetik bis zum ganzzahligen μs-Wert
+        xi = int(x * 1024)
+        yi = int(y * 1024)
+
         # Skid Steering: x=Drehung, y=Vorwärts/Rückwärts
-        left_pwm = 1500 + (y * 500) - (x * 300)
-        right_pwm = 1500 + (y * 500) + (x * 300)
+        forward = 1500 + ((yi * self._SKID_FORWARD_US) >> 10)
+        turn = (xi * self._SKID_TURN_US) >> 10
 
         # Begrenzen auf 1000-2000
-        left_pwm = max(1000, min(2000, left_pwm))
-        right_pwm = max(1000, min(2000, right_pwm))
+        left_pwm = max(1000, min(2000, forward - turn))
+        right_pwm = max(1000, min(2000, forward + turn))
+
+        # Joystick sendet oft identische Positionen - exakt unveränderte Werte
+        # nicht erneut an pigpio schicken (keine Toleranz, sonst bliebe ein
+        # Motor bei Rückkehr auf Neutral z.B. auf 1499μs stehen und kriecht)
+        current = self.current_pwm_values
+        if left_pwm == current['left'] and right_pwm == current['right']:
+            return
 
-        self._set_motor_pwm('left', left_pwm)
-        self._set_motor_pwm('right', right_pwm)
+        self._set_motors_direct(left_pwm, right_pwm)
 
     def send_can_command(self, cmd_type, data=None):
         """Sendet JSON-Befehl an Sensor Hub über CAN"""
@@ -508,8 +669,8 @@ def main():
     )
     
     try:
-        while True:
-            time.sleep(0.1)
+        # Blockiert bis ein Signal eintrifft (kein Polling im Hauptthread)
+        signal.pause()
     except KeyboardInterrupt:
         print("\n🛑 Controller beendet")
 
@@ -6,9 +6,13 @@ JSON-basierte Kommunikation mit Multi-Frame-Support
 
 import json
 import logging
+import os
+import random
 import struct
 import threading
 import time
+import weakref
+from collections import deque
 from typing import Optional, Dict, Any, Callable
 
 try:
@@ -21,6 +25,14 @@ except ImportError:
 from .can_protocol import CANProtocol
 
 
+def _shutdown_bus(bus):
+    """Fährt den CAN-Bus herunter (Finalizer ohne Referenz auf den Handler)"""
+    try:
+        bus.shutdown()
+    except Exception:
+        pass
+
+
 class CANHandler:
     """
     CAN-Bus-Handler für JSON-Kommunikation mit Sensor Hub
@@ -40,6 +52,7 @@ class CANHandler:
         # CAN-Bus
         self.can_available = CAN_AVAILABLE
         self.can_bus: Optional[can.interface.Bus] = None
+        self._bus_finalizer: Optional[weakref.finalize] = None
         self.can_enabled = bool(getattr(config, 'enabled', True))
         
         # Protokoll
@@ -48,11 +61,35 @@ class CANHandler:
             frame_timeout=config.frame_timeout
         )
         
+        # Parameterlose Standardbefehle sind byte-identisch - einmal kodieren
+        self._command_frames: Dict[str, list] = {
+            cmd: self.protocol.encode_message({'cmd': cmd})
+            for cmd in ('status_request', 'restart')
+        }
+        
+        # Senden: wiederverwendete Message-Vorlage; der Lock verhindert, dass
+        # sich Frames zweier Nachrichten auf dem Bus vermischen
+        self._tx_message = None
+        self._tx_lock = threading.Lock()
+        self.tx_batch_size = max(1, int(getattr(config, 'tx_batch_size', 4)))
+        self.tx_batch_delay = float(getattr(config, 'tx_batch_delay', 0.0))
+        
         # Reader-Thread
         self.reader_running = False
         self.reader_thread: Optional[threading.Thread] = None
         self._stop_event = threading.Event()
         
+        # Decode-Thread: Reassembly, JSON und Callbacks laufen getrennt vom
+        # Empfang, damit langsame Callbacks den Socket-Puffer nicht aufstauen.
+        # Begrenzter Ring (ein Schreiber, ein Leser): hängen die Callbacks,
+        # verdrängen neue Frames die ältesten statt veraltete Telemetrie zu stauen
+        self.decode_thread: Optional[threading.Thread] = None
+        self.rx_queue_size = max(1, int(getattr(config, 'rx_queue_size', 512)))
+        self._rx_queue: deque = deque(maxlen=self.rx_queue_size)
+        self._rx_ready = threading.Event()
+        self.rx_dropped_frames = 0
+        self._json_decode = json.JSONDecoder().decode
+        
         # Sensor-Daten
         self._sensor_data: Dict[str, Any] = {}
         self._sensor_data_lock = threading.Lock()
@@ -87,8 +124,11 @@ class CANHandler:
         try:
             self.can_bus = can.interface.Bus(
                 channel=self.config.interface,
-                interface='socketcan'
+                interface='socketcan',
+                can_filters=self._build_can_filters()
             )
+            # Bus auch ohne expliziten cleanup()-Aufruf freigeben (GC/Exit)
+            self._bus_finalizer = weakref.finalize(self, _shutdown_bus, self.can_bus)
             self.logger.info(f"✅ CAN-Bus initialisiert ({self.config.interface}, {self.config.bitrate} bps)")
         
         except Exception as e:
@@ -96,6 +136,21 @@ class CANHandler:
             self.can_available = False
             self.can_bus = None
     
+    def _build_can_filters(self) -> list:
+        """
+        Kernel-Filter für den Reader: nur Sensor-Hub-Nachrichten und die
+        ausgewerteten ODrive CAN-Simple Antworten (Heartbeat, GET_IQ,
+        Sensorless-Schätzwerte) wecken den Thread auf.
+        
+        Returns:
+            Liste von python-can Filter-Dictionaries
+        """
+        filters = [{'can_id': self.config.sensor_hub_id, 'can_mask': 0x7FF, 'extended': False}]
+        for cmd_id in (0x01, 0x14, 0x15):
+            # Arbitration-ID = (node_id << 5) | cmd_id - Node-ID beliebig
+            filters.append({'can_id': cmd_id, 'can_mask': 0x1F, 'extended': False})
+        return filters
+    
     def start_reader(self):
         """Startet CAN-Reader-Thread"""
         if not self.can_enabled:
@@ -111,6 +166,10 @@ class CANHandler:
         
         self.reader_running = True
         self._stop_event.clear()
+        self._rx_queue = deque(maxlen=self.rx_queue_size)
+        self._rx_ready.clear()
+        self.decode_thread = threading.Thread(target=self._decode_loop, daemon=True)
+        self.decode_thread.start()
         self.reader_thread = threading.Thread(target=self._reader_loop, daemon=True)
         self.reader_thread.start()
         self.logger.info("✅ CAN-Reader gestartet")
@@ -122,15 +181,44 @@ class CANHandler:
         
         self.reader_running = False
         self._stop_event.set()
+        # Decode-Thread aus dem Warten aufwecken
+        self._rx_queue.append(None)
+        self._rx_ready.set()
         
         if self.reader_thread:
             self.reader_thread.join(timeout=2.0)
+        if self.decode_thread:
+            self.decode_thread.join(timeout=2.0)
         
         self.logger.info("CAN-Reader gestoppt")
     
+    def _apply_reader_scheduling(self):
+        """
+        Setzt optional CPU-Affinität und SCHED_FIFO für den aufrufenden
+        Reader-Thread (Linux, benötigt CAP_SYS_NICE). Fehler werden nur
+        geloggt - der Reader läuft dann mit Standard-Scheduling weiter.
+        """
+        cpu = int(getattr(self.config, 'reader_cpu', -1))
+        priority = int(getattr(self.config, 'reader_rt_priority', 0))
+        
+        if cpu >= 0:
+            try:
+                os.sched_setaffinity(0, {cpu})
+                self.logger.info(f"CAN-Reader an CPU {cpu} gebunden")
+            except (AttributeError, OSError, ValueError) as e:
+                self.logger.warning(f"⚠️ CAN-Reader CPU-Affinität nicht gesetzt: {e}")
+        
+        if priority > 0:
+            try:
+                os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(priority))
+                self.logger.info(f"CAN-Reader läuft mit SCHED_FIFO Priorität {priority}")
+            except (AttributeError, OSError, ValueError) as e:
+                self.logger.warning(f"⚠️ CAN-Reader SCHED_FIFO nicht gesetzt: {e}")
+    
     def _reader_loop(self):
         """CAN-Reader-Loop mit Error-Recovery"""
         self.logger.info("CAN-Reader-Loop gestartet")
+        self._apply_reader_scheduling()
         error_count = 0
         max_errors = 10
         
@@ -146,19 +234,14 @@ class CANHandler:
                 if msg is None:
                     continue
                 
-                # Sensor Hub Nachrichten verarbeiten
+                # Sensor Hub Frames an den Decode-Thread übergeben
                 if msg.arbitration_id == self.config.sensor_hub_id:
-                    json_str = self.protocol.decode_frame(msg.arbitration_id, msg.data)
-                    
-                    if json_str:
-                        try:
-                            data = json.loads(json_str)
-                            self._process_sensor_data(data, source='can')
-                            error_count = 0  # Reset bei Erfolg
-                        
-                        except json.JSONDecodeError as e:
-                            self.logger.error(f"❌ JSON-Decode Fehler: {e}")
-                            error_count += 1
+                    rx_queue = self._rx_queue
+                    if len(rx_queue) == self.rx_queue_size:
+                        self.rx_dropped_frames += 1  # append() verdrängt den ältesten
+                    rx_queue.append((msg.arbitration_id, bytes(msg.data)))
+                    self._rx_ready.set()
+                    error_count = 0  # Reset bei Erfolg
 
                 # ODrive/ODESC Heartbeat (CAN-Simple cmd 0x01) auswerten
                 # fw-v0.5.6 format: [uint32 error LE][uint8 state]
@@ -207,9 +290,6 @@ class CANHandler:
                             self.logger.error(
                                 f"❌ ODrive-Sensorless Callback Fehler: {e}"
                             )
-
-                # Alte Buffers aufräumen
-                self.protocol.cleanup_old_buffers()
             
             except Exception as e:
                 self.logger.error(f"❌ CAN-Reader Fehler: {e}")
@@ -221,11 +301,47 @@ class CANHandler:
                     self._stop_event.wait(5.0)
                     error_count = 0
                 else:
-                    backoff_time = min(0.1 * (2 ** error_count), 2.0)
-                    self._stop_event.wait(backoff_time)
+                    # Jitter (0.5x-1.5x), damit konkurrierende Leser nicht
+                    # im Gleichtakt erneut zugreifen
+                    backoff_time = min(0.1 * (1 << min(error_count, 5)), 2.0)
+                    self._stop_event.wait(backoff_time * (0.5 + random.random()))
         
         self.logger.info("CAN-Reader-Loop beendet")
     
+    def _decode_loop(self):
+        """Setzt Sensor-Hub-Frames zusammen und verarbeitet die JSON-Nachrichten"""
+        rx_queue = self._rx_queue
+        rx_ready = self._rx_ready
+        while not self._stop_event.is_set():
+            try:
+                item = rx_queue.popleft()
+            except IndexError:
+                # Erst zurücksetzen, dann erneut prüfen: ein Frame, der
+                # dazwischen ankommt, setzt das Event danach wieder
+                rx_ready.clear()
+                if rx_queue:
+                    continue
+                if not rx_ready.wait(1.0):
+                    # Alte Buffers aufräumen (nur in Empfangspausen nötig, sonst
+                    # prüft decode_frame den Timeout beim nächsten Frame)
+                    self.protocol.cleanup_old_buffers()
+                continue
+            
+            if item is None:
+                break
+            
+            try:
+                json_str = self.protocol.decode_frame(*item)
+                
+                if json_str:
+                    data = self._json_decode(json_str)
+                    self._process_sensor_data(data, source='can')
+            
+            except json.JSONDecodeError as e:
+                self.logger.error(f"❌ JSON-Decode Fehler: {e}")
+            except Exception as e:
+                self.logger.error(f"❌ CAN-Decode Fehler: {e}")
+    
     def _process_sensor_data(self, data: Dict[str, Any], source: str = 'can'):
         """
         Verarbeitet Daten vom Sensor Hub (Thread-Safe).
@@ -251,14 +367,17 @@ class CANHandler:
             raise ValueError(f"Unbekannte SensorHub-Quelle: {source}")
 
         now = time.monotonic()
+        # Eigene Kopie veröffentlichen: _sensor_data wird danach nur noch
+        # als Ganzes ersetzt, nie verändert (lockfreies Lesen)
+        snapshot = dict(data)
         with self._sensor_data_lock:
             self._sensor_sources[source] = {
-                'data': dict(data),
+                'data': snapshot,
                 'last_seen_monotonic': now,
             }
             if source != self._active_sensor_source:
                 return
-            self._sensor_data = data
+            self._sensor_data = snapshot
             self._last_sensor_data_monotonic = now
 
         # Callback aufrufen
@@ -280,18 +399,20 @@ class CANHandler:
         with self._sensor_data_lock:
             self._active_sensor_source = source
             cached = self._sensor_sources[source]
-            self._sensor_data = dict(cached['data'])
+            self._sensor_data = cached['data']
             self._last_sensor_data_monotonic = cached['last_seen_monotonic']
     
     def get_sensor_data(self) -> Dict[str, Any]:
         """
-        Gibt letzte Sensor-Daten zurück (Thread-Safe)
+        Gibt letzte Sensor-Daten zurück (Thread-Safe, ohne Lock)
+        
+        Der Snapshot wird vom Reader nur per Referenz ersetzt und darf vom
+        Aufrufer nicht verändert werden.
         
         Returns:
             Dictionary mit Sensor-Daten
         """
-        with self._sensor_data_lock:
-            return self._sensor_data.copy()
+        return self._sensor_data
     
     def send_command(self, cmd_type: str, data: Optional[Dict[str, Any]] = None) -> bool:
         """
@@ -313,23 +434,38 @@ class CANHandler:
             msg_data = {'cmd': cmd_type}
             if data:
                 msg_data.update(data)
+                frames = None
+            else:
+                frames = self._command_frames.get(cmd_type)
             
             # In Frames kodieren
-            frames = self.protocol.encode_message(msg_data)
+            if frames is None:
+                frames = self.protocol.encode_message(msg_data)
             
             if not frames:
                 return False
             
-            # Frames senden
-            for frame_data in frames:
-                msg = can.Message(
-                    arbitration_id=self.config.motor_controller_id,
-                    data=frame_data,
-                    is_extended_id=False
-                )
-                self.can_bus.send(msg)
+            # Optional in kleinen Bursts senden, damit der TX-Puffer des Treibers
+            # bei langen Nachrichten nicht überläuft. Der Lock muss die ganze
+            # Nachricht umfassen (sonst vermischen sich Frames gleicher ID),
+            # daher blockiert eine Pause alle anderen Sender - Standard: aus
+            pace = self.tx_batch_delay > 0
+            with self._tx_lock:
+                msg = self._tx_message
+                if msg is None:
+                    msg = self._tx_message = can.Message(
+                        arbitration_id=self.config.motor_controller_id,
+                        is_extended_id=False
+                    )
+                
+                for frame_idx, frame_data in enumerate(frames):
+                    if pace and frame_idx and frame_idx % self.tx_batch_size == 0:
+                        time.sleep(self.tx_batch_delay)
+                    msg.data = frame_data
+                    msg.dlc = len(frame_data)
+                    self.can_bus.send(msg)
             
-            self.logger.debug(f"📤 CAN-Befehl gesendet: {msg_data}")
+            self.logger.debug("📤 CAN-Befehl gesendet: %s", msg_data)
             return True
         
         except Exception as e:
@@ -522,6 +658,7 @@ class CANHandler:
             'interface': self.config.interface,
             'bitrate': self.config.bitrate,
             'protocol_status': self.protocol.get_buffer_status(),
+            'rx_dropped_frames': self.rx_dropped_frames,
             'interface_online': interface_online,
             'sensor_hub': {
                 'online': sensor_online,
@@ -547,15 +684,20 @@ class CANHandler:
         """Cleanup CAN-Handler"""
         self.stop_reader()
         
-        if self.can_bus:
-            try:
-                self.can_bus.shutdown()
-            except:
-                pass
+        if self._bus_finalizer is not None:
+            # Finalizer läuft höchstens einmal
+            self._bus_finalizer()
+        elif self.can_bus:
+            _shutdown_bus(self.can_bus)
         
         self.logger.info("CAN-Handler cleanup durchgeführt")
     
-    def __del__(self):
-        """Destruktor - Cleanup bei Objektzerstörung"""
+    def __enter__(self):
+        """Startet den Reader beim Betreten des Kontexts"""
+        self.start_reader()
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Cleanup beim Verlassen des Kontexts"""
         self.cleanup()
 
@@ -11,6 +11,34 @@ import time
 from typing import Optional, Dict, Any
 
 
+# Nutzdaten pro CAN-Frame (8 Bytes abzüglich [frame_idx, total_frames])
+_FRAME_PAYLOAD_SIZE = 6
+_MAX_FRAMES = 255
+_ZEROS = memoryview(bytes(_MAX_FRAMES * _FRAME_PAYLOAD_SIZE))
+
+
+class _FrameBuffer:
+    """Wiederverwendbarer Reassembly-Buffer für eine Multi-Frame-Nachricht"""
+
+    __slots__ = ('data', 'total', 'complete_mask', 'received_mask', 'timestamp')
+
+    def __init__(self):
+        self.data = bytearray(_MAX_FRAMES * _FRAME_PAYLOAD_SIZE)
+        self.total = 0
+        self.complete_mask = 0
+        self.received_mask = 0
+        self.timestamp = 0.0
+
+    def reset(self, total_frames: int, timestamp: float):
+        """Startet eine neue Nachricht mit ``total_frames`` Frames"""
+        used = total_frames * _FRAME_PAYLOAD_SIZE
+        self.data[:used] = _ZEROS[:used]
+        self.total = total_frames
+        self.complete_mask = (1 << total_frames) - 1
+        self.received_mask = 0
+        self.timestamp = timestamp
+
+
 class CANProtocol:
     """
     CAN-Protokoll für Multi-Frame JSON-Nachrichten
@@ -28,9 +56,13 @@ class CANProtocol:
         self.logger = logging.getLogger(__name__)
         self.max_frame_size = max_frame_size
         self.frame_timeout = frame_timeout
+        # Encoder einmalig binden; kompakte Separatoren sparen CAN-Frames
+        self._encode = json.JSONEncoder(separators=(',', ':')).encode
         
-        # Thread-Safe Frame-Buffer
-        self._frame_buffer: Dict[int, Dict[str, Any]] = {}
+        # Thread-Safe Frame-Buffer: es wird nur eine Sensor-Hub-ID verarbeitet,
+        # daher genügt ein einzelner Slot (-1 = keine Nachricht in Arbeit)
+        self._active_id = -1
+        self._active_buf = _FrameBuffer()
         self._buffer_lock = threading.Lock()
     
     def encode_message(self, data: Dict[str, Any]) -> list:
@@ -45,29 +77,30 @@ class CANProtocol:
         """
         try:
             # JSON serialisieren
-            json_str = json.dumps(data)
+            json_str = self._encode(data)
             json_bytes = json_str.encode('utf-8')
             
-            # In Chunks aufteilen
-            chunks = []
-            for i in range(0, len(json_bytes), self.max_frame_size):
-                chunk = json_bytes[i:i + self.max_frame_size]
-                chunks.append(chunk)
+            # Frame-Format: [frame_idx, total_frames, ...data (max 6 bytes)],
+            # auf 8 Bytes aufgefüllt (CAN-Standard). Alle Frames in einem
+            # vorab genullten Buffer aufbauen - Padding entfällt damit.
+            chunk_size = self.max_frame_size
+            frame_len = max(8, chunk_size + 2)
+            total_frames = (len(json_bytes) + chunk_size - 1) // chunk_size
+            buf = bytearray(total_frames * frame_len)
+            view = memoryview(buf)
+            payload = memoryview(json_bytes)
             
-            # Frames erstellen
-            total_frames = len(chunks)
-            frames = []
+            for frame_idx in range(total_frames):
+                offset = frame_idx * frame_len
+                buf[offset] = frame_idx
+                buf[offset + 1] = total_frames
+                chunk = payload[frame_idx * chunk_size:(frame_idx + 1) * chunk_size]
+                view[offset + 2:offset + 2 + len(chunk)] = chunk
             
-            for frame_idx, chunk in enumerate(chunks):
-                # Frame-Format: [frame_idx, total_frames, ...data (max 6 bytes)]
-                frame_data = bytearray([frame_idx, total_frames])
-                frame_data.extend(chunk)
-                
-                # Auf 8 Bytes auffüllen (CAN-Standard)
-                while len(frame_data) < 8:
-                    frame_data.append(0x00)
-                
-                frames.append(bytes(frame_data))
+            frames = [
+                bytes(view[offset:offset + frame_len])
+                for offset in range(0, len(buf), frame_len)
+            ]
             
             return frames
         
@@ -94,50 +127,57 @@ class CANProtocol:
         chunk = frame_data[2:8]  # Max 6 Bytes Nutzdaten
         
         with self._buffer_lock:
-            # Ersten Frame: Buffer initialisieren
+            buffer = self._active_buf
+            # Erster Frame: Slot für diese ID (neu) belegen
             if frame_idx == 0:
-                self._frame_buffer[arbitration_id] = {
-                    'total': total_frames,
-                    'frames': [None] * total_frames,
-                    'timestamp': time.time()
-                }
+                buffer.reset(total_frames, time.monotonic())
+                self._active_id = arbitration_id
+            elif arbitration_id != self._active_id:
+                return None
+            elif time.monotonic() - buffer.timestamp > self.frame_timeout:
+                # Verspäteter Folge-Frame: unvollständige Nachricht verwerfen
+                self._active_id = -1
+                self.logger.warning(f"⚠️ Frame-Buffer Timeout für ID 0x{arbitration_id:X}")
+                return None
             
-            # Frame im Buffer speichern
-            if arbitration_id in self._frame_buffer:
-                buffer = self._frame_buffer[arbitration_id]
-                
-                if frame_idx < len(buffer['frames']):
-                    buffer['frames'][frame_idx] = chunk
+            # Frame direkt an seine Position im Buffer schreiben
+            if frame_idx < buffer.total:
+                offset = frame_idx * _FRAME_PAYLOAD_SIZE
+                buffer.data[offset:offset + len(chunk)] = chunk
+                buffer.received_mask |= 1 << frame_idx
+            
+            # Prüfen ob alle Frames empfangen (ein Bit pro Frame)
+            if buffer.received_mask == buffer.complete_mask:
+                # Null-Bytes entfernen
+                full_data = buffer.data[:buffer.total * _FRAME_PAYLOAD_SIZE].rstrip(b'\x00')
+                # Slot freigeben
+                self._active_id = -1
                 
-                # Prüfen ob alle Frames empfangen
-                if all(f is not None for f in buffer['frames']):
-                    # Alle Frames zusammensetzen
-                    full_data = b''.join(buffer['frames'])
-                    # Null-Bytes entfernen
-                    full_data = full_data.rstrip(b'\x00')
-                    # Buffer leeren
-                    del self._frame_buffer[arbitration_id]
-                    
-                    try:
-                        return full_data.decode('utf-8')
-                    except UnicodeDecodeError as e:
-                        self.logger.error(f"❌ UTF-8 Decode Fehler: {e}")
-                        return None
+                try:
+                    return full_data.decode('utf-8')
+                except UnicodeDecodeError as e:
+                    self.logger.error(f"❌ UTF-8 Decode Fehler: {e}")
+                    return None
         
         return None
     
     def cleanup_old_buffers(self):
-        """Entfernt alte unvollständige Buffers (Thread-Safe)"""
-        current_time = time.time()
+        """
+        Verwirft eine unvollständige Nachricht nach Timeout (Thread-Safe)
+        
+        decode_frame prüft den Timeout bereits beim nächsten Frame; dieser
+        Aufruf ist nur für Pausen ohne weitere Frames nötig.
+        """
+        # Normalfall: keine Nachricht in Arbeit - ohne Lock zurück
+        if self._active_id == -1:
+            return
+        
+        current_time = time.monotonic()
         
         with self._buffer_lock:
-            expired_ids = [
-                arb_id for arb_id, buffer in self._frame_buffer.items()
-                if current_time - buffer['timestamp'] > self.frame_timeout
-            ]
-            
-            for arb_id in expired_ids:
-                del self._frame_buffer[arb_id]
+            arb_id = self._active_id
+            if arb_id != -1 and current_time - self._active_buf.timestamp > self.frame_timeout:
+                self._active_id = -1
                 self.logger.warning(f"⚠️ Frame-Buffer Timeout für ID 0x{arb_id:X}")
     
     def get_buffer_status(self) -> Dict[str, Any]:
@@ -148,8 +188,9 @@ class CANProtocol:
             Dictionary mit Buffer-Informationen
         """
         with self._buffer_lock:
+            active = self._active_id != -1
             return {
-                'active_buffers': len(self._frame_buffer),
-                'buffer_ids': [f"0x{arb_id:X}" for arb_id in self._frame_buffer.keys()]
+                'active_buffers': 1 if active else 0,
+                'buffer_ids': [f"0x{self._active_id:X}"] if active else []
             }
 
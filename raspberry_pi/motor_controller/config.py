@@ -6,11 +6,17 @@ Zentrale Konfigurationsverwaltung mit YAML-Support
 
 import yaml
 import os
-from dataclasses import dataclass, field
+from dataclasses import asdict, dataclass, field
 from typing import List, Dict, Any
 
+# libyaml-Backend verwenden wenn vorhanden (deutlich schneller auf dem Pi)
+try:
+    from yaml import CSafeLoader as _YamlLoader, CSafeDumper as _YamlDumper
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader, SafeDumper as _YamlDumper
 
-@dataclass
+
+@dataclass(slots=True)
 class PWMConfig:
     """PWM-Konfiguration"""
     enabled: bool = False
@@ -25,7 +31,7 @@ class PWMConfig:
     turn_factor: float = 300.0
 
 
-@dataclass
+@dataclass(slots=True)
 class RampingConfig:
     """Ramping-Konfiguration"""
     enabled: bool = True
@@ -33,9 +39,10 @@ class RampingConfig:
     deceleration_rate: int = 800  # μs/s
     brake_rate: int = 1500  # μs/s
     update_interval: float = 0.02  # 50Hz
+    rt_priority: int = 0  # SCHED_FIFO-Priorität für den Ramping-Thread (0 = aus)
 
 
-@dataclass
+@dataclass(slots=True)
 class SafetyConfig:
     """Sicherheits-Konfiguration"""
     pin: int = 17
@@ -48,14 +55,14 @@ class SafetyConfig:
     can_watchdog_interval_s: float = 0.1
 
 
-@dataclass
+@dataclass(slots=True)
 class LightConfig:
     """Licht-Konfiguration"""
     enabled: bool = True
     pin: int = 22
 
 
-@dataclass
+@dataclass(slots=True)
 class MowerConfig:
     """Mäher-Konfiguration"""
     enabled: bool = True
@@ -67,7 +74,7 @@ class MowerConfig:
     duty_off: int = 0  # %
 
 
-@dataclass
+@dataclass(slots=True)
 class ODriveMowerConfig:
     """ODrive/ODESC-Mähdeck über CAN oder direkte USB-Verbindungen."""
     enabled: bool = False
@@ -118,7 +125,7 @@ class ODriveMowerConfig:
     current_critical_trip_duration_s: float = 0.1
 
 
-@dataclass
+@dataclass(slots=True)
 class CANConfig:
     """CAN-Bus-Konfiguration"""
     enabled: bool = True
@@ -128,9 +135,15 @@ class CANConfig:
     sensor_hub_id: int = 0x100
     max_frame_size: int = 6  # Bytes Nutzdaten pro Frame
     frame_timeout: float = 1.0  # Sekunden
+    tx_batch_size: int = 4  # Frames pro Sende-Burst
+    tx_batch_delay: float = 0.0  # Sekunden Pause zwischen Bursts (0 = ohne Pause)
+    rx_queue_size: int = 512  # Max. gepufferte Sensor-Hub-Frames (älteste werden verworfen)
+    # Echtzeit-Optionen für den Reader-Thread (benötigen CAP_SYS_NICE)
+    reader_rt_priority: int = 0  # SCHED_FIFO-Priorität (0 = aus)
+    reader_cpu: int = -1  # CPU-Kern für den Reader (-1 = beliebig)
 
 
-@dataclass
+@dataclass(slots=True)
 class SensorHubConfig:
     """Transport der SensorHub-Telemetrie zum Hauptrechner."""
     transport: str = 'can'  # can, shadow oder wifi
@@ -145,7 +158,7 @@ class SensorHubConfig:
     telemetry_timeout_s: float = 30.0
 
 
-@dataclass
+@dataclass(slots=True)
 class NavigationConfig:
     """Autonome Wegpunktnavigation (S1-Bearing-Hold).
 
@@ -211,7 +224,7 @@ class NavigationConfig:
     min_inner_wheel_speed: float = 0.50
 
 
-@dataclass
+@dataclass(slots=True)
 class MappingConfig:
     """Drive-around Kartierung und GeoJSON-Speicher."""
     enabled: bool = True
@@ -219,7 +232,7 @@ class MappingConfig:
     min_point_distance_m: float = 0.25
 
 
-@dataclass
+@dataclass(slots=True)
 class WebConfig:
     """Web-Interface-Konfiguration"""
     enabled: bool = False
@@ -231,7 +244,7 @@ class WebConfig:
     max_speed_percent: float = 100.0
 
 
-@dataclass
+@dataclass(slots=True)
 class LoggingConfig:
     """Logging-Konfiguration"""
     level: str = 'INFO'  # DEBUG, INFO, WARNING, ERROR, CRITICAL
@@ -241,7 +254,7 @@ class LoggingConfig:
     file_enabled: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class Config:
     """Haupt-Konfiguration"""
     pwm: PWMConfig = field(default_factory=PWMConfig)
@@ -267,7 +280,7 @@ class Config:
             raise FileNotFoundError(f"Config-Datei nicht gefunden: {filepath}")
         
         with open(filepath, 'r') as f:
-            data = yaml.safe_load(f)
+            data = yaml.load(f, Loader=_YamlLoader)
         
         return cls.from_dict(data)
     
@@ -313,151 +326,12 @@ class Config:
     
     def to_yaml(self, filepath: str):
         """Speichert Konfiguration als YAML-Datei"""
-        data = {
-            'pwm': {
-                'enabled': self.pwm.enabled,
-                'pins': self.pwm.pins,
-                'frequency': self.pwm.frequency,
-                'neutral_value': self.pwm.neutral_value,
-                'min_value': self.pwm.min_value,
-                'max_value': self.pwm.max_value,
-                'forward_factor': self.pwm.forward_factor,
-                'turn_factor': self.pwm.turn_factor
-            },
-            'ramping': {
-                'enabled': self.ramping.enabled,
-                'acceleration_rate': self.ramping.acceleration_rate,
-                'deceleration_rate': self.ramping.deceleration_rate,
-                'brake_rate': self.ramping.brake_rate,
-                'update_interval': self.ramping.update_interval
-            },
-            'safety': {
-                'pin': self.safety.pin,
-                'enabled': self.safety.enabled,
-                'debounce_time': self.safety.debounce_time,
-                'command_timeout': self.safety.command_timeout,
-                'joystick_timeout': self.safety.joystick_timeout,
-                'can_watchdog_enabled': self.safety.can_watchdog_enabled,
-                'can_watchdog_startup_grace_s': self.safety.can_watchdog_startup_grace_s,
-                'can_watchdog_interval_s': self.safety.can_watchdog_interval_s
-            },
-            'light': {
-                'enabled': self.light.enabled,
-                'pin': self.light.pin
-            },
-            'mower': {
-                'enabled': self.mower.enabled,
-                'relay_pin': self.mower.relay_pin,
-                'pwm_pin': self.mower.pwm_pin,
-                'pwm_frequency': self.mower.pwm_frequency,
-                'duty_min': self.mower.duty_min,
-                'duty_max': self.mower.duty_max,
-                'duty_off': self.mower.duty_off
-            },
-            'odrive_mower': {
-                'enabled': self.odrive_mower.enabled,
-                'transport': self.odrive_mower.transport,
-                'node_id': self.odrive_mower.node_id,
-                'node_ids': self.odrive_mower.node_ids,
-                'usb_axes': self.odrive_mower.usb_axes,
-                'usb_connect_timeout_s': self.odrive_mower.usb_connect_timeout_s,
-                'usb_reconnect_interval_s': self.odrive_mower.usb_reconnect_interval_s,
-                'usb_idle_poll_interval_s': self.odrive_mower.usb_idle_poll_interval_s,
-                'usb_startup_hang_timeout_s': self.odrive_mower.usb_startup_hang_timeout_s,
-                'axis_state': self.odrive_mower.axis_state,
-                'min_rpm': self.odrive_mower.min_rpm,
-                'max_rpm': self.odrive_mower.max_rpm,
-                'default_rpm': self.odrive_mower.default_rpm,
-                'ramp_rate_rpm_s': self.odrive_mower.ramp_rate_rpm_s,
-                'command_interval_s': self.odrive_mower.command_interval_s,
-                'coast_delay_s': self.odrive_mower.coast_delay_s,
-                'start_stagger_s': self.odrive_mower.start_stagger_s,
-                'sequential_start_enabled': self.odrive_mower.sequential_start_enabled,
-                'startup_timeout_s': self.odrive_mower.startup_timeout_s,
-                'startup_retries': self.odrive_mower.startup_retries,
-                'startup_current_limit_a': self.odrive_mower.startup_current_limit_a,
-                'startup_abort_current_a': self.odrive_mower.startup_abort_current_a,
-                'startup_min_sensorless_rpm': self.odrive_mower.startup_min_sensorless_rpm,
-                'startup_stable_duration_s': self.odrive_mower.startup_stable_duration_s,
-                'operating_current_limit_a': self.odrive_mower.operating_current_limit_a,
-                'heartbeat_timeout_s': self.odrive_mower.heartbeat_timeout_s,
-                'usb_status_timeout_s': self.odrive_mower.usb_status_timeout_s,
-                'current_monitor_enabled': self.odrive_mower.current_monitor_enabled,
-                'current_poll_interval_s': self.odrive_mower.current_poll_interval_s,
-                'current_poll_while_idle': self.odrive_mower.current_poll_while_idle,
-                'current_response_timeout_s': self.odrive_mower.current_response_timeout_s,
-                'current_startup_grace_s': self.odrive_mower.current_startup_grace_s,
-                'current_trip_a': self.odrive_mower.current_trip_a,
-                'current_trip_duration_s': self.odrive_mower.current_trip_duration_s,
-                'current_critical_trip_a': self.odrive_mower.current_critical_trip_a,
-                'current_critical_trip_duration_s': self.odrive_mower.current_critical_trip_duration_s
-            },
-            'can': {
-                'enabled': self.can.enabled,
-                'interface': self.can.interface,
-                'bitrate': self.can.bitrate,
-                'motor_controller_id': self.can.motor_controller_id,
-                'sensor_hub_id': self.can.sensor_hub_id,
-                'max_frame_size': self.can.max_frame_size,
-                'frame_timeout': self.can.frame_timeout
-            },
-            'sensor_hub': {
-                'transport': self.sensor_hub.transport,
-                'wifi_url': self.sensor_hub.wifi_url,
-                'poll_interval_s': self.sensor_hub.poll_interval_s,
-                'request_timeout_s': self.sensor_hub.request_timeout_s,
-                'pause_timeout_s': self.sensor_hub.pause_timeout_s,
-                'telemetry_timeout_s': self.sensor_hub.telemetry_timeout_s
-            },
-            'navigation': {
-                'enabled': self.navigation.enabled,
-                'watchdog_timeout_s': self.navigation.watchdog_timeout_s,
-                'rtk_resume_stable_s': self.navigation.rtk_resume_stable_s,
-                'rtk_lost_timeout_s': self.navigation.rtk_lost_timeout_s,
-                'geofence_radius_m': self.navigation.geofence_radius_m,
-                'max_joystick': self.navigation.max_joystick,
-                'acceptance_radius_m': self.navigation.acceptance_radius_m,
-                'slowdown_radius_m': self.navigation.slowdown_radius_m,
-                'turn_kp': self.navigation.turn_kp,
-                'track_lookahead_m': self.navigation.track_lookahead_m,
-                'pivot_heading_threshold_deg': self.navigation.pivot_heading_threshold_deg,
-                'goto_divergence_limit_m': self.navigation.goto_divergence_limit_m,
-                'goto_divergence_samples': self.navigation.goto_divergence_samples,
-                'track_cross_track_limit_m': self.navigation.track_cross_track_limit_m,
-                'track_alignment_enter_deg': self.navigation.track_alignment_enter_deg,
-                'track_alignment_exit_deg': self.navigation.track_alignment_exit_deg,
-                'track_heading_block_deg': self.navigation.track_heading_block_deg,
-                'track_stall_timeout_s': self.navigation.track_stall_timeout_s,
-                'track_stall_min_progress_m': self.navigation.track_stall_min_progress_m,
-                'min_inner_wheel_speed': self.navigation.min_inner_wheel_speed
-            },
-            'mapping': {
-                'enabled': self.mapping.enabled,
-                'maps_dir': self.mapping.maps_dir,
-                'min_point_distance_m': self.mapping.min_point_distance_m
-            },
-            'web': {
-                'enabled': self.web.enabled,
-                'host': self.web.host,
-                'port': self.web.port,
-                'secret_key': self.web.secret_key,
-                'template_folder': self.web.template_folder,
-                'static_folder': self.web.static_folder,
-                'max_speed_percent': self.web.max_speed_percent
-            },
-            'logging': {
-                'level': self.logging.level,
-                'format': self.logging.format,
-                'file': self.logging.file,
-                'console': self.logging.console,
-                'file_enabled': self.logging.file_enabled
-            },
-            'quiet': self.quiet,
-            'monitor': self.monitor
-        }
+        # Rekursiv aus den Dataclass-Feldern - neue Felder werden automatisch
+        # mitgespeichert
+        data = asdict(self)
         
         with open(filepath, 'w') as f:
-            yaml.dump(data, f, default_flow_style=False, sort_keys=False)
+            yaml.dump(data, f, Dumper=_YamlDumper, default_flow_style=False, sort_keys=False)
     
     @classmethod
     def default(cls) -> 'Config':
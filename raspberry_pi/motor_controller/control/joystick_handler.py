@@ -29,17 +29,43 @@ class JoystickHandler:
         self.logger = logging.getLogger(__name__)
         self.motor = motor_control
         self.safety = safety_monitor
+        # Einmalig auflösen statt hasattr() bei jedem Joystick-Frame
+        self._is_motion_allowed = getattr(safety_monitor, 'is_motion_allowed', None)
         
-        # Joystick-Status
-        self.enabled = False
-        self.x = 0.0
-        self.y = 0.0
-        self.last_update = 0
-        self.max_speed = 100.0  # Prozent
+        # Joystick-Status als unveränderliches Tupel
+        # (enabled, x, y, last_update, max_speed). Schreiber ersetzen es mit
+        # einer einzigen Zuweisung, Leser erhalten ohne Lock einen
+        # konsistenten Snapshot.
+        self._state = (False, 0.0, 0.0, 0, 100.0)
 
-        # Thread-Safety
+        # Nur Schreiber serialisieren (Web-Thread und Timeout-Überwachung)
         self._lock = threading.Lock()
     
+    @property
+    def enabled(self) -> bool:
+        """Joystick-Steuerung aktiv"""
+        return self._state[0]
+    
+    @property
+    def x(self) -> float:
+        """X-Achse (-1.0 bis 1.0)"""
+        return self._state[1]
+    
+    @property
+    def y(self) -> float:
+        """Y-Achse (-1.0 bis 1.0)"""
+        return self._state[2]
+    
+    @property
+    def last_update(self) -> float:
+        """Zeitpunkt der letzten Joystick-Eingabe"""
+        return self._state[3]
+    
+    @property
+    def max_speed(self) -> float:
+        """Maximale Geschwindigkeit in Prozent"""
+        return self._state[4]
+    
     def update(self, x: float, y: float):
         """
         Aktualisiert Joystick-Position (Thread-Safe)
@@ -48,32 +74,30 @@ class JoystickHandler:
             x: X-Achse (-1.0 bis 1.0)
             y: Y-Achse (-1.0 bis 1.0)
         """
-        if hasattr(self.safety, 'is_motion_allowed') and not self.safety.is_motion_allowed():
+        if self._is_motion_allowed is not None and not self._is_motion_allowed():
             self.motor.emergency_stop()
             self.logger.warning("Joystick-Befehl wegen verriegeltem Sicherheitsstopp verworfen")
             return False
 
+        x = max(-1.0, min(1.0, x))
+        y = max(-1.0, min(1.0, y))
         with self._lock:
-            self.x = max(-1.0, min(1.0, x))
-            self.y = max(-1.0, min(1.0, y))
-            self.last_update = time.time()
-            self.enabled = True
+            self._state = (True, x, y, time.time(), self._state[4])
         
         # Safety Monitor aktualisieren
         self.safety.update_joystick_time()
         
         # Motor-Steuerung aktualisieren (ohne Ramping für direkte Kontrolle)
-        self.motor.set_joystick(self.x, self.y, use_ramping=False)
+        self.motor.set_joystick(x, y, use_ramping=False)
         
-        self.logger.debug(f"Joystick: x={self.x:.2f}, y={self.y:.2f}")
+        self.logger.debug("Joystick: x=%.2f, y=%.2f", x, y)
         return True
     
     def disable(self):
         """Deaktiviert Joystick-Steuerung"""
         with self._lock:
-            self.enabled = False
-            self.x = 0.0
-            self.y = 0.0
+            _, _, _, last_update, max_speed = self._state
+            self._state = (False, 0.0, 0.0, last_update, max_speed)
         
         # Motoren auf Neutral
         self.motor.emergency_stop()
@@ -86,8 +110,8 @@ class JoystickHandler:
         Returns:
             Tuple (x, y)
         """
-        with self._lock:
-            return self.x, self.y
+        state = self._state
+        return state[1], state[2]
     
     def is_enabled(self) -> bool:
         """
@@ -96,8 +120,7 @@ class JoystickHandler:
         Returns:
             True wenn aktiviert, False sonst
         """
-        with self._lock:
-            return self.enabled
+        return self._state[0]
     
     def set_max_speed(self, max_speed: float):
         """
@@ -106,10 +129,11 @@ class JoystickHandler:
         Args:
             max_speed: Maximale Geschwindigkeit in Prozent (0-100)
         """
+        max_speed = max(0.0, min(100.0, max_speed))
         with self._lock:
-            self.max_speed = max(0.0, min(100.0, max_speed))
+            self._state = self._state[:4] + (max_speed,)
 
-        self.logger.info(f"Max Speed: {self.max_speed}%")
+        self.logger.info(f"Max Speed: {max_speed}%")
 
     def get_status(self) -> dict:
         """
@@ -118,11 +142,11 @@ class JoystickHandler:
         Returns:
             Dictionary mit Status-Informationen
         """
-        with self._lock:
-            return {
-                'enabled': self.enabled,
-                'x': self.x,
-                'y': self.y,
-                'last_update': self.last_update,
-                'max_speed': self.max_speed
-            }
+        enabled, x, y, last_update, max_speed = self._state
+        return {
+            'enabled': enabled,
+            'x': x,
+            'y': y,
+            'last_update': last_update,
+            'max_speed': max_speed
+        }
@@ -5,9 +5,37 @@ Zentrale Motor-Steuerungslogik mit optionalem Ramping
 """
 
 import logging
+import os
 import threading
 import time
-from typing import Dict, Tuple
+from typing import Dict, Optional, Tuple
+
+
+def _skid_steering(x: float, y: float, neutral: int, forward_factor: float,
+                   turn_factor: float, min_value: int, max_value: int) -> Tuple[int, int]:
+    """
+    Skid-Steering-Kern: Joystick-Achsen -> begrenzte PWM-Werte (μs)
+    
+    Reine Skalar-Rechnung ohne Attributzugriffe; Begrenzung per Vergleich
+    statt verschachteltem max()/min().
+    """
+    # Vorzeichen für x vertauscht, da Motoren physisch vertauscht sind
+    forward = neutral + y * forward_factor
+    turn = x * turn_factor
+    left = int(forward + turn)
+    right = int(forward - turn)
+    
+    # Begrenzen auf min/max
+    if left < min_value:
+        left = min_value
+    elif left > max_value:
+        left = max_value
+    if right < min_value:
+        right = min_value
+    elif right > max_value:
+        right = max_value
+    
+    return left, right
 
 
 class MotorControl:
@@ -31,22 +59,29 @@ class MotorControl:
         self.pwm_config = config.pwm
         self.ramping_config = config.ramping
         
+        # Konfigurationswerte für den Hot-Path einmalig als Attribute ablegen
+        self._neutral = config.pwm.neutral_value
+        self._forward_factor = config.pwm.forward_factor
+        self._turn_factor = config.pwm.turn_factor
+        self._min_value = config.pwm.min_value
+        self._max_value = config.pwm.max_value
+        
         # Ramping
+        # Ist- und Zielwerte als unveränderliche (left, right)-Tupel: Leser
+        # brauchen keinen Lock. Der Lock serialisiert nur Schreiber, die PWM
+        # setzen (Ramping-Tick vs. Direktwert/Notaus), damit ein veralteter
+        # Ramping-Schritt nie nach einem Notaus an die Hardware geht
+        self._lock = threading.Lock()
         self.ramping_enabled = config.ramping.enabled
-        self.current_values: Dict[str, int] = {
-            'left': self.pwm_config.neutral_value,
-            'right': self.pwm_config.neutral_value
-        }
-        self.target_values: Dict[str, int] = {
-            'left': self.pwm_config.neutral_value,
-            'right': self.pwm_config.neutral_value
-        }
+        neutral = self.pwm_config.neutral_value
+        self._current: Tuple[int, int] = (neutral, neutral)
+        self._target: Tuple[int, int] = (neutral, neutral)
         
         # Ramping-Thread
         self.ramping_running = False
         self.ramping_thread: Optional[threading.Thread] = None
         self._stop_event = threading.Event()
-        self._lock = threading.Lock()
+        self._target_event = threading.Event()  # Neues Ziel für den Ramping-Loop
         
         if self.ramping_enabled:
             self.start_ramping()
@@ -62,47 +97,27 @@ class MotorControl:
         Returns:
             Tuple (left_pwm, right_pwm) in μs
         """
-        # Skid Steering Formel
-        # Vorzeichen für x vertauscht, da Motoren physisch vertauscht sind
-        left_pwm = (
-            self.pwm_config.neutral_value +
-            (y * self.pwm_config.forward_factor) +
-            (x * self.pwm_config.turn_factor)
-        )
-
-        right_pwm = (
-            self.pwm_config.neutral_value +
-            (y * self.pwm_config.forward_factor) -
-            (x * self.pwm_config.turn_factor)
+        return _skid_steering(
+            x, y, self._neutral, self._forward_factor, self._turn_factor,
+            self._min_value, self._max_value
         )
-        
-        # Begrenzen auf min/max
-        left_pwm = max(
-            self.pwm_config.min_value,
-            min(self.pwm_config.max_value, int(left_pwm))
-        )
-        right_pwm = max(
-            self.pwm_config.min_value,
-            min(self.pwm_config.max_value, int(right_pwm))
-        )
-        
-        return left_pwm, right_pwm
     
     def set_motor_direct(self, left: int, right: int):
         """
         Setzt Motor-PWM direkt (ohne Ramping)
         
+        Schreibt immer an die Hardware, auch bei unverändertem Cache-Wert:
+        Notaus und Direktbefehle dürfen nicht übersprungen werden.
+        
         Args:
             left: PWM-Wert links in μs
             right: PWM-Wert rechts in μs
         """
-        self.pwm.set_motor_pwm_both(left, right)
-        
+        values = (left, right)
         with self._lock:
-            self.current_values['left'] = left
-            self.current_values['right'] = right
-            self.target_values['left'] = left
-            self.target_values['right'] = right
+            self.pwm.set_motor_pwm_both(left, right, force=True)
+            self._current = values
+            self._target = values
     
     def set_motor_target(self, left: int, right: int):
         """
@@ -112,13 +127,13 @@ class MotorControl:
             left: Ziel-PWM-Wert links in μs
             right: Ziel-PWM-Wert rechts in μs
         """
-        with self._lock:
-            self.target_values['left'] = left
-            self.target_values['right'] = right
+        self._target = (left, right)
         
         # Wenn Ramping deaktiviert, direkt setzen
         if not self.ramping_enabled:
             self.set_motor_direct(left, right)
+        else:
+            self._target_event.set()
     
     def set_joystick(self, x: float, y: float, use_ramping: bool = False):
         """
@@ -138,8 +153,7 @@ class MotorControl:
     
     def emergency_stop(self):
         """Notaus - Motoren sofort auf Neutral"""
-        neutral = self.pwm_config.neutral_value
-        self.set_motor_direct(neutral, neutral)
+        self.set_motor_direct(self._neutral, self._neutral)
         self.logger.warning("🛑 EMERGENCY STOP - Motoren neutral")
     
     def start_ramping(self):
@@ -161,60 +175,122 @@ class MotorControl:
         
         self.ramping_running = False
         self._stop_event.set()
+        self._target_event.set()
         
         if self.ramping_thread:
             self.ramping_thread.join(timeout=2.0)
         
         self.logger.info("Ramping gestoppt")
     
+    def _apply_ramping_scheduling(self):
+        """
+        Setzt optional SCHED_FIFO für den aufrufenden Ramping-Thread (Linux,
+        benötigt CAP_SYS_NICE). Fehler werden nur geloggt - das Ramping läuft
+        dann mit Standard-Scheduling weiter.
+        """
+        priority = int(getattr(self.ramping_config, 'rt_priority', 0))
+        if priority <= 0:
+            return
+        
+        try:
+            os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(priority))
+            self.logger.info(f"Ramping läuft mit SCHED_FIFO Priorität {priority}")
+        except (AttributeError, OSError, ValueError) as e:
+            self.logger.warning(f"⚠️ Ramping SCHED_FIFO nicht gesetzt (CAP_SYS_NICE?): {e}")
+    
+    @staticmethod
+    def _ramp_value(current: int, target: int, neutral: int,
+                    accel_step: float, decel_step: float, brake_step: float) -> int:
+        """
+        Berechnet den nächsten Ramping-Wert einer Seite
+        
+        Args:
+            current: Aktueller PWM-Wert in μs
+            target: Ziel-PWM-Wert in μs
+            neutral: Neutral-PWM-Wert in μs
+            accel_step: Maximale Änderung pro Intervall beim Beschleunigen
+            decel_step: Maximale Änderung pro Intervall beim Verzögern
+            brake_step: Maximale Änderung pro Intervall beim Bremsen zu Neutral
+            
+        Returns:
+            Neuer PWM-Wert in μs
+        """
+        diff = target - current
+        if not diff:
+            return current
+        
+        # Rate: Bremsen zu Neutral, Beschleunigen oder Verzögern
+        if target == neutral:
+            max_step = brake_step
+        elif abs(target - neutral) > abs(current - neutral):
+            max_step = accel_step
+        else:
+            max_step = decel_step
+        
+        # Schritt auf maximale Änderung pro Intervall begrenzen
+        if diff > 0:
+            return int(current + min(diff, max_step))
+        return int(current - min(-diff, max_step))
+    
     def _ramping_loop(self):
         """Ramping-Loop - Sanfte Beschleunigung/Bremsung"""
         self.logger.info("Ramping-Loop gestartet")
+        self._apply_ramping_scheduling()
+        
+        # Konfiguration ist zur Laufzeit konstant: Schrittweiten pro
+        # Intervall einmalig berechnen statt in jedem Tick pro Seite
+        dt = self.ramping_config.update_interval
+        neutral = self._neutral
+        accel_step = self.ramping_config.acceleration_rate * dt
+        decel_step = self.ramping_config.deceleration_rate * dt
+        brake_step = self.ramping_config.brake_rate * dt
+        ramp_value = self._ramp_value
+        # Fester Takt: Deadline statt fester Wartezeit, damit die Rechenzeit
+        # eines Ticks nicht zum Intervall hinzukommt
+        next_tick = time.monotonic()
         
         while not self._stop_event.is_set():
             try:
-                dt = self.ramping_config.update_interval
+                self._target_event.clear()
                 
-                with self._lock:
-                    for side in ['left', 'right']:
-                        current = self.current_values[side]
-                        target = self.target_values[side]
-                        neutral = self.pwm_config.neutral_value
-                        
-                        if current == target:
+                # Snapshot in lokale Variablen, dann rechnen, dann veröffentlichen
+                # (links/rechts entpackt, beide Seiten ausgerollt statt per Index)
+                target = self._target
+                cur_l, cur_r = self._current
+                tgt_l, tgt_r = target
+                if cur_l != tgt_l or cur_r != tgt_r:
+                    cur_l = ramp_value(cur_l, tgt_l, neutral,
+                                       accel_step, decel_step, brake_step)
+                    cur_r = ramp_value(cur_r, tgt_r, neutral,
+                                       accel_step, decel_step, brake_step)
+
+                    # Neues Ziel (oder Direktwert/Notaus) während der Berechnung:
+                    # verwerfen und mit aktuellem Stand neu rechnen. Prüfung,
+                    # Veröffentlichung und PWM-Schreiben atomar unter dem Lock
+                    with self._lock:
+                        if self._target is not target:
                             continue
-                        
-                        # Rate bestimmen
-                        if target == neutral:
-                            # Bremsen zu Neutral
-                            rate = self.ramping_config.brake_rate
-                        elif abs(target - neutral) > abs(current - neutral):
-                            # Beschleunigen
-                            rate = self.ramping_config.acceleration_rate
-                        else:
-                            # Verzögern
-                            rate = self.ramping_config.deceleration_rate
-                        
-                        # Maximale Änderung berechnen
-                        max_change = rate * dt
-                        
-                        # Neue PWM berechnen
-                        diff = target - current
-                        if abs(diff) <= max_change:
-                            new_value = target
-                        else:
-                            new_value = current + (max_change if diff > 0 else -max_change)
-                        
-                        self.current_values[side] = int(new_value)
-                
-                # PWM setzen
-                self.pwm.set_motor_pwm_both(
-                    self.current_values['left'],
-                    self.current_values['right']
-                )
+                        self._current = (cur_l, cur_r)
+
+                        # PWM nur setzen wenn sich der Wert in diesem Tick geändert hat
+                        self.pwm.set_motor_pwm_both(cur_l, cur_r)
+
+                settled = cur_l == tgt_l and cur_r == tgt_r
                 
-                # Wartezeit
-                self._stop_event.wait(dt)
+                # Wartezeit: Ziel erreicht -> bis zum nächsten Zielwert schlafen
+                # statt im festen Intervall zu pollen
+                if settled:
+                    self._target_event.wait()
+                    next_tick = time.monotonic()
+                else:
+                    next_tick += dt
+                    remaining = next_tick - time.monotonic()
+                    if remaining > 0:
+                        self._stop_event.wait(remaining)
+                    elif remaining < -2 * dt:
+                        # Deutlich überzogen: neu takten statt Ticks nachzuholen
+                        self.logger.debug("Ramping-Tick %.1f ms verspätet", -remaining * 1000)
+                        next_tick = time.monotonic()
             
             except Exception as e:
                 self.logger.error(f"❌ Ramping-Loop Fehler: {e}")
@@ -222,6 +298,24 @@ class MotorControl:
         
         self.logger.info("Ramping-Loop beendet")
     
+    def get_current_pair(self) -> Tuple[int, int]:
+        """
+        Gibt aktuelle PWM-Werte als unveränderliches Tupel zurück (ohne Kopie)
+        
+        Returns:
+            Tuple (left, right) in μs
+        """
+        return self._current
+    
+    def get_target_pair(self) -> Tuple[int, int]:
+        """
+        Gibt Ziel-PWM-Werte als unveränderliches Tupel zurück (ohne Kopie)
+        
+        Returns:
+            Tuple (left, right) in μs
+        """
+        return self._target
+    
     def get_current_values(self) -> Dict[str, int]:
         """
         Gibt aktuelle PWM-Werte zurück (Thread-Safe)
@@ -229,8 +323,8 @@ class MotorControl:
         Returns:
             Dictionary mit 'left' und 'right' PWM-Werten
         """
-        with self._lock:
-            return self.current_values.copy()
+        left, right = self._current
+        return {'left': left, 'right': right}
     
     def get_target_values(self) -> Dict[str, int]:
         """
@@ -239,8 +333,8 @@ class MotorControl:
         Returns:
             Dictionary mit 'left' und 'right' PWM-Werten
         """
-        with self._lock:
-            return self.target_values.copy()
+        left, right = self._target
+        return {'left': left, 'right': right}
     
     def get_status(self) -> Dict[str, any]:
         """
@@ -249,11 +343,13 @@ class MotorControl:
         Returns:
             Dictionary mit Status-Informationen
         """
+        current_left, current_right = self._current
+        target_left, target_right = self._target
         return {
             'ramping_enabled': self.ramping_enabled,
             'ramping_running': self.ramping_running,
-            'current_values': self.get_current_values(),
-            'target_values': self.get_target_values()
+            'current_values': {'left': current_left, 'right': current_right},
+            'target_values': {'left': target_left, 'right': target_right}
         }
     
     def cleanup(self):
@@ -262,7 +358,11 @@ class MotorControl:
         self.emergency_stop()
         self.logger.info("Motor Control cleanup durchgeführt")
     
-    def __del__(self):
-        """Destruktor - Cleanup bei Objektzerstörung"""
+    def __enter__(self):
+        """Kontextmanager: gibt die Instanz zurück"""
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Cleanup beim Verlassen des Kontexts"""
         self.cleanup()
 
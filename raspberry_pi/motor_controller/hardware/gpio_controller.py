@@ -26,6 +26,7 @@ class GPIOController:
     
     _instance: Optional['GPIOController'] = None
     _lock = threading.Lock()
+    _ready = False  # Singleton bereits initialisiert
     
     def __new__(cls):
         """Singleton-Pattern: Nur eine Instanz erlaubt"""
@@ -37,11 +38,12 @@ class GPIOController:
     
     def __init__(self):
         """Initialisiert GPIO-Controller (nur beim ersten Aufruf)"""
-        # Verhindert mehrfache Initialisierung
-        if hasattr(self, '_initialized'):
+        # Verhindert mehrfache Initialisierung (Klassen-Flag statt hasattr())
+        cls = type(self)
+        if cls._ready:
             return
         
-        self._initialized = True
+        cls._ready = True
         self.logger = logging.getLogger(__name__)
         self.gpio_available = GPIO_AVAILABLE
         self.gpio_mode_set = False
@@ -199,6 +201,10 @@ class GPIOController:
         except Exception as e:
             self.logger.error(f"❌ GPIO cleanup fehlgeschlagen: {e}")
     
-    def __del__(self):
-        """Destruktor - Cleanup bei Objektzerstörung"""
+    def __enter__(self):
+        """Kontextmanager: gibt die Instanz zurück"""
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Cleanup beim Verlassen des Kontexts"""
         self.cleanup()
@@ -9,6 +9,19 @@ import threading
 from typing import Dict, Optional
 from ..config import PWMConfig, MowerConfig
 
+# Schnellerer Lock für den kaum umkämpften PWM-Pfad, falls installiert
+try:
+    from fastrlock.rlock import FastRLock as _PWMLock
+    FASTRLOCK_AVAILABLE = True
+except ImportError:
+    _PWMLock = threading.Lock
+    FASTRLOCK_AVAILABLE = False
+
+
+def _clamp(value: int, low: int, high: int) -> int:
+    """Begrenzt value auf [low, high] (Vergleiche statt max()/min())"""
+    return low if value < low else high if value > high else value
+
 
 class PWMController:
     """
@@ -31,18 +44,26 @@ class PWMController:
         self.gpio = gpio_controller
         self.pi = gpio_controller.get_pigpio()
         
-        self._lock = threading.Lock()  # Thread-Safety für PWM-Zugriffe
+        self._lock = _PWMLock()  # Thread-Safety für PWM-Zugriffe
+        
+        # Konfigurationswerte für den Hot-Path einmalig als Attribute ablegen
+        self._frequency = pwm_config.frequency
+        self._pin_left = pwm_config.pins['left']
+        self._pin_right = pwm_config.pins['right']
+        self._min_value = pwm_config.min_value
+        self._max_value = pwm_config.max_value
         
         # Motor-PWM-Status
         self.motor_enabled = pwm_config.enabled
-        self.current_values: Dict[str, int] = {
-            'left': pwm_config.neutral_value,
-            'right': pwm_config.neutral_value
-        }
+        # Zuletzt gesetzte Werte als unveränderliches (left, right)-Tupel:
+        # wird unter dem Lock ersetzt, Leser brauchen keinen Lock
+        self._values = (pwm_config.neutral_value, pwm_config.neutral_value)
         
         # Mäher-PWM-Status
         self.mower_enabled = mower_config.enabled
         self.mower_speed = 0  # 0-100%
+        # Hardware-Duty (0-1000000) je ganzzahliger Geschwindigkeit 0-100% vorberechnen
+        self._mower_duty_table = [self._mower_duty(speed) for speed in range(101)]
         
         if self.motor_enabled:
             self._init_motor_pwm()
@@ -61,7 +82,7 @@ class PWMController:
             for side, pin in self.config.pins.items():
                 # Hardware-PWM: 50Hz, 1500μs (neutral)
                 # Duty cycle berechnen: (1500μs / 20000μs) * 1000000 = 75000
-                duty_cycle = int((self.config.neutral_value / 20000.0) * 1000000)
+                duty_cycle = self.config.neutral_value * 50
                 self.pi.hardware_PWM(
                     pin,
                     self.config.frequency,
@@ -107,52 +128,86 @@ class PWMController:
         if not self.motor_enabled or not self.pi:
             return False
         
-        if side not in self.config.pins:
+        # Gecachte Pins statt Dict-Lookup in self.config.pins
+        if side == 'left':
+            pin = self._pin_left
+        elif side == 'right':
+            pin = self._pin_right
+        else:
             self.logger.error(f"❌ Ungültige Motor-Seite: {side}")
             return False
         
         # Wert begrenzen
-        value = max(self.config.min_value, min(self.config.max_value, value))
+        value = _clamp(value, self._min_value, self._max_value)
 
         try:
             with self._lock:
-                pin = self.config.pins[side]
-                # Duty cycle berechnen: (value_μs / 20000μs) * 1000000
-                duty_cycle = int((value / 20000.0) * 1000000)
-                self.pi.hardware_PWM(pin, self.config.frequency, duty_cycle)
-                self.current_values[side] = value
+                # Duty cycle berechnen: (value_μs / 20000μs) * 1000000 = value * 50
+                duty_cycle = int(value) * 50
+                self.pi.hardware_PWM(pin, self._frequency, duty_cycle)
+                left, right = self._values
+                self._values = (value, right) if side == 'left' else (left, value)
             return True
         
         except Exception as e:
             self.logger.error(f"❌ Motor-PWM Fehler ({side}): {e}")
             return False
     
-    def set_motor_pwm_both(self, left: int, right: int) -> bool:
+    def set_motor_pwm_both(self, left: int, right: int, force: bool = False) -> bool:
         """
         Setzt beide Motor-PWM-Werte gleichzeitig (Thread-Safe)
         
         Args:
             left: PWM-Wert links in μs (1000-2000)
             right: PWM-Wert rechts in μs (1000-2000)
+            force: Immer an pigpio schreiben, auch wenn der Cache den Wert
+                bereits enthält (Notaus, Neutral, Cleanup)
             
         Returns:
             True bei Erfolg, False bei Fehler
         """
-        success = True
-        success &= self.set_motor_pwm('left', left)
-        success &= self.set_motor_pwm('right', right)
-        return success
+        if not self.motor_enabled or not self.pi:
+            return False
+        
+        # Werte begrenzen und Duty Cycles (value_μs / 20000μs * 1000000 = value * 50)
+        # außerhalb des Locks berechnen
+        min_value = self._min_value
+        max_value = self._max_value
+        left = _clamp(int(left), min_value, max_value)
+        right = _clamp(int(right), min_value, max_value)
+        duty_left = left * 50
+        duty_right = right * 50
+        frequency = self._frequency
+        
+        try:
+            # Beide Seiten in einem kritischen Abschnitt direkt nacheinander
+            # setzen, damit links und rechts nie auseinanderlaufen
+            with self._lock:
+                # Unveränderte Werte nicht erneut an pigpio senden (nur für den
+                # Ramping-Takt; Notaus/Neutral schreiben immer)
+                values = (left, right)
+                if not force and self._values == values:
+                    return True
+                self.pi.hardware_PWM(self._pin_left, frequency, duty_left)
+                self.pi.hardware_PWM(self._pin_right, frequency, duty_right)
+                self._values = values
+            return True
+        
+        except Exception as e:
+            self.logger.error(f"❌ Motor-PWM Fehler: {e}")
+            return False
     
     def set_motor_neutral(self) -> bool:
         """
-        Setzt beide Motoren auf Neutral (1500μs)
+        Setzt beide Motoren auf Neutral (1500μs), immer mit pigpio-Schreibzugriff
         
         Returns:
             True bei Erfolg, False bei Fehler
         """
         return self.set_motor_pwm_both(
             self.config.neutral_value,
-            self.config.neutral_value
+            self.config.neutral_value,
+            force=True
         )
     
     def get_motor_pwm(self, side: str) -> int:
@@ -165,8 +220,12 @@ class PWMController:
         Returns:
             PWM-Wert in μs
         """
-        with self._lock:
-            return self.current_values.get(side, self.config.neutral_value)
+        left, right = self._values
+        if side == 'left':
+            return left
+        if side == 'right':
+            return right
+        return self.config.neutral_value
     
     def get_motor_pwm_both(self) -> Dict[str, int]:
         """
@@ -175,8 +234,24 @@ class PWMController:
         Returns:
             Dictionary mit 'left' und 'right' PWM-Werten
         """
-        with self._lock:
-            return self.current_values.copy()
+        left, right = self._values
+        return {'left': left, 'right': right}
+    
+    def _mower_duty(self, speed: float) -> int:
+        """
+        Berechnet den Hardware-Duty-Cycle für eine Mäher-Geschwindigkeit
+        
+        Args:
+            speed: Geschwindigkeit 0-100% (bereits begrenzt)
+            
+        Returns:
+            Duty Cycle im Hardware-PWM-Format (0-1000000)
+        """
+        cfg = self.mower_config
+        # 0% -> duty_off, sonst linear duty_min-duty_max
+        if speed == 0:
+            return int(cfg.duty_off * 10000)
+        return int((cfg.duty_min + (speed / 100.0) * (cfg.duty_max - cfg.duty_min)) * 10000)
     
     def set_mower_speed(self, speed: int) -> bool:
         """
@@ -192,22 +267,16 @@ class PWMController:
             return False
         
         # Geschwindigkeit begrenzen
-        speed = max(0, min(100, speed))
+        speed = _clamp(speed, 0, 100)
+        # Ganzzahlige Werte aus der Tabelle, Zwischenwerte (z.B. 99.9) exakt
+        # rechnen statt auf die Tabelle abzuschneiden
+        if type(speed) is int:
+            duty_cycle_hw = self._mower_duty_table[speed]
+        else:
+            duty_cycle_hw = self._mower_duty(speed)
         
         try:
             with self._lock:
-                # Duty Cycle berechnen: 0% -> duty_off, 100% -> duty_max
-                if speed == 0:
-                    duty_cycle = self.mower_config.duty_off
-                else:
-                    # Linear mapping: 1-100% -> duty_min-duty_max
-                    duty_cycle = self.mower_config.duty_min + (
-                        (speed / 100.0) * (self.mower_config.duty_max - self.mower_config.duty_min)
-                    )
-                
-                # Duty Cycle in Hardware-PWM-Format konvertieren (0-1000000)
-                duty_cycle_hw = int(duty_cycle * 10000)  # % -> 0-1000000
-                
                 self.pi.hardware_PWM(
                     self.mower_config.pwm_pin,
                     self.mower_config.pwm_frequency,
@@ -215,7 +284,8 @@ class PWMController:
                 )
                 
                 self.mower_speed = speed
-                self.logger.debug(f"Mäher-Geschwindigkeit: {speed}% (Duty: {duty_cycle:.1f}%)")
+            
+            self.logger.debug("Mäher-Geschwindigkeit: %s%% (Duty: %.1f%%)", speed, duty_cycle_hw / 10000)
             
             return True
         
@@ -256,7 +326,11 @@ class PWMController:
         except Exception as e:
             self.logger.error(f"❌ PWM cleanup fehlgeschlagen: {e}")
     
-    def __del__(self):
-        """Destruktor - Cleanup bei Objektzerstörung"""
+    def __enter__(self):
+        """Kontextmanager: gibt die Instanz zurück"""
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Cleanup beim Verlassen des Kontexts"""
         self.cleanup()
 
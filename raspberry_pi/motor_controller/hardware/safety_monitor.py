@@ -38,13 +38,20 @@ class SafetyMonitor:
         
         # Sicherheitsschalter
         self.safety_enabled = config.enabled
-        self.last_safety_trigger = 0
+        self.last_safety_trigger_ns: Optional[int] = None
         self._safety_event_detect_active = False
         
         # Timeout-Überwachung
+        # Intervalle in monotonen Nanosekunden (unabhängig von NTP-Sprüngen);
+        # last_*_time bleibt als Wanduhrzeit nur für get_status()
+        self._command_timeout_ns = int(config.command_timeout * 1e9)
+        self._joystick_timeout_ns = int(config.joystick_timeout * 1e9)
+        self._debounce_ns = int(config.debounce_time * 1e9)
         self.last_command_time = time.time()
+        self.last_command_time_ns = time.monotonic_ns()
         self.command_active = False
         self.last_joystick_time = 0
+        self.last_joystick_time_ns = 0
         self.joystick_active = False
         
         # Emergency Stop Callback
@@ -69,6 +76,7 @@ class SafetyMonitor:
         # Thread-Safety
         self._lock = threading.Lock()
         self._stop_event = threading.Event()
+        self._wakeup_event = threading.Event()  # Neue Timeout-Deadline für den Watchdog
         
         if self.safety_enabled:
             self._init_safety_switch()
@@ -110,14 +118,15 @@ class SafetyMonitor:
     
     def _safety_callback(self, channel):
         """Callback für Sicherheitsschalter (mit Debouncing)"""
-        current_time = time.time()
+        now_ns = time.monotonic_ns()
         
         with self._lock:
             # Debouncing
-            if current_time - self.last_safety_trigger < self.config.debounce_time:
+            last_ns = self.last_safety_trigger_ns
+            if last_ns is not None and now_ns - last_ns < self._debounce_ns:
                 return
             
-            self.last_safety_trigger = current_time
+            self.last_safety_trigger_ns = now_ns
         
         self.logger.warning("🚨 SICHERHEITSSCHALTER AUSGELÖST!")
         self.trigger_system_stop("Sicherheitsschalter ausgeloest")
@@ -238,8 +247,15 @@ class SafetyMonitor:
     def update_command_time(self):
         """Aktualisiert letzten Command-Zeitstempel"""
         with self._lock:
+            self.last_command_time_ns = time.monotonic_ns()
             self.last_command_time = time.time()
+            was_active = self.command_active
             self.command_active = True
+        
+        # Nur eine neu aktivierte Überwachung bringt eine frühere Deadline;
+        # spätere Zeitstempel verschieben sie lediglich nach hinten
+        if not was_active:
+            self._wakeup_event.set()
 
     def deactivate_command_watchdog(self):
         """Deaktiviert den Navigations-Command-Watchdog im Stillstand."""
@@ -249,8 +265,13 @@ class SafetyMonitor:
     def update_joystick_time(self):
         """Aktualisiert letzten Joystick-Zeitstempel"""
         with self._lock:
+            self.last_joystick_time_ns = time.monotonic_ns()
             self.last_joystick_time = time.time()
+            was_active = self.joystick_active
             self.joystick_active = True
+        
+        if not was_active:
+            self._wakeup_event.set()
     
     def check_command_timeout(self) -> bool:
         """
@@ -262,8 +283,7 @@ class SafetyMonitor:
         with self._lock:
             if not self.command_active:
                 return False
-            elapsed = time.time() - self.last_command_time
-            return elapsed > self.config.command_timeout
+            return time.monotonic_ns() - self.last_command_time_ns > self._command_timeout_ns
     
     def check_joystick_timeout(self) -> bool:
         """
@@ -276,8 +296,28 @@ class SafetyMonitor:
             if not self.joystick_active:
                 return False
             
-            elapsed = time.time() - self.last_joystick_time
-            return elapsed > self.config.joystick_timeout
+            return time.monotonic_ns() - self.last_joystick_time_ns > self._joystick_timeout_ns
+    
+    def _next_timeout_delay(self) -> Optional[float]:
+        """
+        Berechnet die Zeit bis zur frühesten aktiven Timeout-Deadline
+        
+        Returns:
+            Sekunden bis zur Deadline, None wenn kein Timeout aktiv ist
+        """
+        with self._lock:
+            deadline = None
+            if self.command_active:
+                deadline = self.last_command_time_ns + self._command_timeout_ns
+            if self.joystick_active:
+                joystick_deadline = self.last_joystick_time_ns + self._joystick_timeout_ns
+                if deadline is None or joystick_deadline < deadline:
+                    deadline = joystick_deadline
+        
+        if deadline is None:
+            return None
+        # Kleine Untergrenze: die Prüfung ist strikt (elapsed > timeout)
+        return max(0.001, (deadline - time.monotonic_ns()) / 1e9)
     
     def start_watchdog(self):
         """Startet Watchdog-Thread"""
@@ -304,6 +344,7 @@ class SafetyMonitor:
         
         self.watchdog_running = False
         self._stop_event.set()
+        self._wakeup_event.set()
         
         if self.watchdog_thread:
             self.watchdog_thread.join(timeout=2.0)
@@ -316,6 +357,9 @@ class SafetyMonitor:
         
         while not self._stop_event.is_set():
             try:
+                # Vor den Prüfungen zurücksetzen, damit kein Aufwecken verloren geht
+                self._wakeup_event.clear()
+                
                 # Command-Timeout prüfen
                 if self.check_command_timeout():
                     self.logger.warning("⚠️ Command-Timeout überschritten!")
@@ -330,7 +374,8 @@ class SafetyMonitor:
                     with self._lock:
                         self.joystick_active = False
 
-                if bool(getattr(self.config, 'can_watchdog_enabled', False)) and self.can_health_check:
+                can_watchdog = bool(getattr(self.config, 'can_watchdog_enabled', False))
+                if can_watchdog and self.can_health_check:
                     grace_s = float(getattr(self.config, 'can_watchdog_startup_grace_s', 5.0))
                     if time.monotonic() - self._watchdog_started_monotonic >= grace_s:
                         if self.motion_hold_check:
@@ -352,9 +397,14 @@ class SafetyMonitor:
                         if not healthy:
                             self.trigger_system_stop(reason or "CAN-Netz ausgefallen")
                 
-                # 100ms Wartezeit
-                interval_s = float(getattr(self.config, 'can_watchdog_interval_s', 0.1))
-                self._stop_event.wait(max(0.02, interval_s))
+                # Bis zur nächsten Timeout-Deadline schlafen statt im festen
+                # Intervall zu pollen; nur der CAN-Healthcheck braucht einen Takt
+                delay = self._next_timeout_delay()
+                if can_watchdog:
+                    interval_s = max(0.02, float(getattr(self.config, 'can_watchdog_interval_s', 0.1)))
+                    if delay is None or delay > interval_s:
+                        delay = interval_s
+                self._wakeup_event.wait(delay)
             
             except Exception as e:
                 self.logger.error(f"❌ Watchdog-Loop Fehler: {e}")
@@ -9,6 +9,7 @@ import logging
 import os
 import signal
 import sys
+import threading
 import time
 import yaml
 from pathlib import Path
@@ -59,8 +60,9 @@ class MotorControllerApp:
         self._sensor_pause_resume_mode = None
         self._sensor_recovery_started_monotonic = None
         
-        # Shutdown-Flag
+        # Shutdown-Flag; das Event weckt run() ohne Polling auf
         self.running = False
+        self._shutdown_event = threading.Event()
         
         # Signal-Handler registrieren
         signal.signal(signal.SIGINT, self._signal_handler)
@@ -107,6 +109,7 @@ class MotorControllerApp:
     def _signal_handler(self, signum, frame):
         """Signal-Handler für SIGINT/SIGTERM"""
         self.logger.info(f"Signal {signum} empfangen - Shutdown wird eingeleitet")
+        self._shutdown_event.set()
         self.shutdown()
     
     def initialize(self):
@@ -293,7 +296,7 @@ class MotorControllerApp:
             # 5 Hz telemetry at INFO filled journald and made targeted fault
             # analysis unnecessarily expensive. It remains available when the
             # service is deliberately run with DEBUG logging.
-            self.logger.debug(f"📡 Sensor-Daten: {data}")
+            self.logger.debug("📡 Sensor-Daten: %s", data)
         if self.navigation:
             self.navigation.on_pose_update(data)
 
@@ -520,6 +523,12 @@ class MotorControllerApp:
     
     def run(self):
         """Haupt-Loop"""
+        # Ohne USB-Mähdeck gibt es nichts zu überwachen: bis zum Shutdown
+        # blockieren statt alle 100 ms aufzuwachen
+        poll_interval = None
+        if self.odrive_mower and getattr(self.odrive_mower, 'transport', 'can') == 'usb':
+            poll_interval = 0.1
+        
         try:
             while self.running:
                 startup_hang = self._odrive_usb_startup_hang_reason()
@@ -534,7 +543,8 @@ class MotorControllerApp:
                         self.motor.emergency_stop()
                     time.sleep(0.2)
                     os._exit(70)
-                time.sleep(0.1)
+                if self._shutdown_event.wait(poll_interval):
+                    break
         
         except KeyboardInterrupt:
             self.logger.info("Keyboard Interrupt empfangen")
@@ -566,6 +576,7 @@ class MotorControllerApp:
     
     def shutdown(self):
         """Fährt alle Komponenten herunter"""
+        self._shutdown_event.set()
         if not self.running:
             return
         
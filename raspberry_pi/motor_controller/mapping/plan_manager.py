@@ -3,6 +3,7 @@
 import json
 import hashlib
 import math
+import re
 import time
 from datetime import datetime, timezone
 from pathlib import Path
@@ -796,8 +797,6 @@ class MowingPlanManager:
 
     @staticmethod
     def _edge_bearing_deg(start: List[float], end: List[float]) -> Optional[float]:
-        import math
-
         latitude = math.radians((float(start[1]) + float(end[1])) / 2.0)
         east = (float(end[0]) - float(start[0])) * math.cos(latitude)
         north = float(end[1]) - float(start[1])
@@ -813,8 +812,6 @@ class MowingPlanManager:
 
     @classmethod
     def _route_heading_error(cls, coords: List[List[float]], heading_deg: float) -> float:
-        import math
-
         for start, end in zip(coords, coords[1:]):
             if cls._coord_distance_m(start, end) <= 0.02:
                 continue
@@ -835,8 +832,6 @@ class MowingPlanManager:
         for start, end in reversed(list(zip(coords, coords[1:]))):
             if cls._coord_distance_m(start, end) <= 0.02:
                 continue
-            import math
-
             latitude = math.radians((float(start[1]) + float(end[1])) / 2.0)
             east = (float(end[0]) - float(start[0])) * math.cos(latitude)
             north = float(end[1]) - float(start[1])
@@ -1082,8 +1077,6 @@ class MowingPlanManager:
     @staticmethod
     def _project_on_segment(point: List[float], start: List[float], end: List[float]) -> List[float]:
         """Foot of the perpendicular from ``point`` onto the segment."""
-        import math
-
         latitude = math.radians(float(point[1]))
         lon_scale = 111320.0 * max(0.01, math.cos(latitude))
         lat_scale = 110540.0
@@ -1105,8 +1098,6 @@ class MowingPlanManager:
     @staticmethod
     def _point_to_line_distance_m(point: List[float], start: List[float], end: List[float]) -> float:
         """Approximate point-to-segment distance in a local metric projection."""
-        import math
-
         latitude = math.radians(float(point[1]))
         lon_scale = 111320.0 * max(0.01, math.cos(latitude))
         lat_scale = 110540.0
@@ -1536,7 +1527,6 @@ class MowingPlanManager:
 
     @staticmethod
     def _sanitize_name(name: str) -> str:
-        import re
         cleaned = re.sub(r"[^A-Za-z0-9_.-]+", "_", str(name).strip())
         return cleaned.strip("._")
 
@@ -0,0 +1,91 @@
+import json
+import unittest
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from motor_controller.communication.can_protocol import CANProtocol
+
+
+class CANProtocolDecodeTests(unittest.TestCase):
+    def setUp(self):
+        self.protocol = CANProtocol()
+
+    def _decode_all(self, frames, arbitration_id=0x100):
+        result = None
+        for frame in frames:
+            result = self.protocol.decode_frame(arbitration_id, frame)
+        return result
+
+    def test_encode_pads_last_frame_and_sets_header(self):
+        frames = self.protocol.encode_message({'a': 12})
+
+        self.assertEqual(frames, [
+            bytes([0, 2]) + b'{"a":1',
+            bytes([1, 2]) + b'2}\x00\x00\x00\x00',
+        ])
+
+    def test_roundtrip_multi_frame(self):
+        message = {'type': 'status', 'value': 'ä' * 10, 'n': 12345}
+        frames = self.protocol.encode_message(message)
+        self.assertGreater(len(frames), 1)
+
+        result = self._decode_all(frames)
+
+        self.assertEqual(json.loads(result), message)
+        self.assertEqual(self.protocol.get_buffer_status()['active_buffers'], 0)
+
+    def test_out_of_order_frames_complete(self):
+        frames = self.protocol.encode_message({'key': 'value-long-enough'})
+        self.assertIsNone(self.protocol.decode_frame(0x100, frames[0]))
+        for frame in reversed(frames[2:]):
+            self.assertIsNone(self.protocol.decode_frame(0x100, frame))
+
+        self.assertEqual(self.protocol.decode_frame(0x100, frames[1]),
+                         '{"key":"value-long-enough"}')
+
+    def test_reused_buffer_does_not_leak_previous_payload(self):
+        long_frames = self.protocol.encode_message({'text': 'x' * 40})
+        short_frames = self.protocol.encode_message({'a': 1})
+
+        self._decode_all(long_frames)
+        # Abgebrochene Nachricht: nur der erste Frame kommt an
+        self.protocol.decode_frame(0x100, long_frames[0])
+
+        self.assertEqual(self._decode_all(short_frames), '{"a":1}')
+
+    def test_frame_without_start_is_ignored(self):
+        frames = self.protocol.encode_message({'key': 'value-long-enough'})
+
+        self.assertIsNone(self.protocol.decode_frame(0x100, frames[1]))
+        self.assertEqual(self.protocol.get_buffer_status()['active_buffers'], 0)
+
+    def test_frames_of_other_id_are_ignored_mid_message(self):
+        frames = self.protocol.encode_message({'key': 'value-long-enough'})
+        self.protocol.decode_frame(0x100, frames[0])
+
+        self.assertIsNone(self.protocol.decode_frame(0x101, frames[1]))
+        self.assertEqual(self.protocol.get_buffer_status()['buffer_ids'], ['0x100'])
+
+    def test_late_continuation_frame_discards_message(self):
+        frames = self.protocol.encode_message({'key': 'value-long-enough'})
+        self.protocol.decode_frame(0x100, frames[0])
+        self.protocol.frame_timeout = 0.0
+
+        for frame in frames[1:]:
+            self.assertIsNone(self.protocol.decode_frame(0x100, frame))
+        self.assertEqual(self.protocol.get_buffer_status()['active_buffers'], 0)
+
+    def test_cleanup_removes_expired_buffers(self):
+        self.protocol.frame_timeout = 0.0
+        frames = self.protocol.encode_message({'key': 'value-long-enough'})
+        self.protocol.decode_frame(0x100, frames[0])
+
+        self.protocol.cleanup_old_buffers()
+
+        self.assertEqual(self.protocol.get_buffer_status()['active_buffers'], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
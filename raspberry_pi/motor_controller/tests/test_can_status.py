@@ -1,9 +1,13 @@
+import gc
 import time
 import struct
+import threading
+import weakref
 import unittest
 from dataclasses import dataclass
 from pathlib import Path
 import sys
+from types import SimpleNamespace
 from unittest.mock import patch
 
 sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
@@ -100,6 +104,17 @@ class CANStatusTests(unittest.TestCase):
         self.assertIsNone(status["sensor_hub"]["can_id"])
         self.assertEqual(self.handler.get_sensor_data(), payload)
 
+    def test_published_sensor_snapshot_is_decoupled_from_input(self):
+        payload = {"imu": {"heading": 90.0}}
+        self.handler._process_sensor_data(payload)
+        snapshot = self.handler.get_sensor_data()
+
+        payload["gps"] = {"lat": 1.0}
+        self.handler._process_sensor_data({"imu": {"heading": 45.0}})
+
+        self.assertEqual(snapshot, {"imu": {"heading": 90.0}})
+        self.assertEqual(self.handler.get_sensor_data(), {"imu": {"heading": 45.0}})
+
     def test_reports_odrive_iq_measurement(self):
         self.handler._record_odrive_heartbeat(2, 0, 1)
         self.handler._record_odrive_iq(2, 12.5, -11.75)
@@ -123,5 +138,229 @@ class CANStatusTests(unittest.TestCase):
         self.assertEqual(status["odrives"]["nodes"]["0"]["state"], 1)
 
 
+class CANFilterTests(unittest.TestCase):
+    def test_kernel_filters_pass_sensor_hub_and_odrive_replies_only(self):
+        with patch("communication.can_handler.CAN_AVAILABLE", False):
+            handler = CANHandler(FakeCANConfig())
+        filters = handler._build_can_filters()
+
+        def accepted(arbitration_id):
+            return any(
+                arbitration_id & f["can_mask"] == f["can_id"] & f["can_mask"]
+                for f in filters
+            )
+
+        self.assertTrue(accepted(0x100))
+        self.assertTrue(accepted((3 << 5) | 0x01))
+        self.assertTrue(accepted((1 << 5) | 0x14))
+        self.assertTrue(accepted((2 << 5) | 0x15))
+        self.assertFalse(accepted(0x200))
+        self.assertFalse(accepted((3 << 5) | 0x0C))
+
+
+class ReaderSchedulingTests(unittest.TestCase):
+    def setUp(self):
+        with patch("communication.can_handler.CAN_AVAILABLE", False):
+            self.handler = CANHandler(FakeCANConfig())
+
+    def test_default_config_leaves_scheduling_untouched(self):
+        with patch("communication.can_handler.os.sched_setaffinity", create=True) as affinity, \
+                patch("communication.can_handler.os.sched_setscheduler", create=True) as scheduler:
+            self.handler._apply_reader_scheduling()
+
+        affinity.assert_not_called()
+        scheduler.assert_not_called()
+
+    def test_permission_error_is_not_fatal(self):
+        self.handler.config.reader_rt_priority = 50
+        with patch(
+            "communication.can_handler.os.sched_setscheduler",
+            side_effect=PermissionError("no CAP_SYS_NICE"),
+            create=True,
+        ) as scheduler:
+            self.handler._apply_reader_scheduling()
+
+        scheduler.assert_called_once()
+
+
+class FakeMessage:
+    def __init__(self, arbitration_id, is_extended_id, data=b""):
+        self.arbitration_id = arbitration_id
+        self.is_extended_id = is_extended_id
+        self.data = data
+        self.dlc = len(data)
+
+
+class FakeBus:
+    def __init__(self):
+        self.sent = []
+
+    def send(self, msg):
+        self.sent.append((msg.arbitration_id, bytes(msg.data), msg.dlc))
+
+
+class FakeRxBus:
+    def __init__(self, frames):
+        self.frames = list(frames)
+
+    def recv(self, timeout=None):
+        if self.frames:
+            arbitration_id, data = self.frames.pop(0)
+            return SimpleNamespace(arbitration_id=arbitration_id, data=data)
+        time.sleep(0.01)
+        return None
+
+    def shutdown(self):
+        pass
+
+
+class CANReaderTests(unittest.TestCase):
+    def test_sensor_hub_frames_are_decoded_off_the_reader_thread(self):
+        with patch("communication.can_handler.CAN_AVAILABLE", False):
+            handler = CANHandler(FakeCANConfig())
+        self.addCleanup(handler.cleanup)
+        frames = handler.protocol.encode_message({"imu": {"heading": 12.0}})
+        handler.can_available = True
+        handler.can_bus = FakeRxBus((0x100, frame) for frame in frames)
+
+        received = []
+        handler.set_sensor_data_callback(
+            lambda data: received.append((threading.current_thread(), data))
+        )
+        handler.start_reader()
+
+        deadline = time.monotonic() + 2.0
+        while not received and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        self.assertEqual(received, [(handler.decode_thread, {"imu": {"heading": 12.0}})])
+        self.assertEqual(handler.get_sensor_data(), {"imu": {"heading": 12.0}})
+
+    def test_full_queue_drops_oldest_frames_while_callback_stalls(self):
+        config = FakeCANConfig()
+        config.rx_queue_size = 2  # genau eine Nachricht mit zwei Frames
+        with patch("communication.can_handler.CAN_AVAILABLE", False):
+            handler = CANHandler(config)
+        self.addCleanup(handler.cleanup)
+        frames = []
+        for seq in range(5):
+            message_frames = handler.protocol.encode_message({"seq": seq})
+            self.assertEqual(len(message_frames), 2)
+            frames.extend((0x100, frame) for frame in message_frames)
+        handler.can_available = True
+        handler.can_bus = FakeRxBus(frames[:2])
+
+        release = threading.Event()
+        received = []
+
+        def stalling_callback(data):
+            received.append(data["seq"])
+            release.wait(2.0)
+
+        handler.set_sensor_data_callback(stalling_callback)
+        handler.start_reader()
+
+        # Erst wenn der Callback hängt, die restlichen Nachrichten nachschieben
+        deadline = time.monotonic() + 2.0
+        while not received and time.monotonic() < deadline:
+            time.sleep(0.01)
+        handler.can_bus.frames.extend(frames[2:])
+
+        deadline = time.monotonic() + 2.0
+        while handler.can_bus.frames and time.monotonic() < deadline:
+            time.sleep(0.01)
+        time.sleep(0.05)
+        release.set()
+
+        deadline = time.monotonic() + 2.0
+        while len(received) < 2 and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        # Erste Nachricht lief schon, danach nur noch die neueste
+        self.assertEqual(received, [0, 4])
+        self.assertEqual(handler.get_status()["rx_dropped_frames"], 6)
+
+
+class CANLifecycleTests(unittest.TestCase):
+    def test_context_manager_runs_reader_and_shuts_down_bus(self):
+        with patch("communication.can_handler.CAN_AVAILABLE", False):
+            handler = CANHandler(FakeCANConfig())
+        bus = FakeRxBus([])
+        bus.shutdown_calls = 0
+        bus.shutdown = lambda: setattr(bus, "shutdown_calls", bus.shutdown_calls + 1)
+        handler.can_available = True
+        handler.can_bus = bus
+
+        with handler:
+            self.assertTrue(handler.reader_running)
+
+        self.assertFalse(handler.reader_running)
+        self.assertEqual(bus.shutdown_calls, 1)
+
+    def test_handler_without_cleanup_is_collectable(self):
+        with patch("communication.can_handler.CAN_AVAILABLE", False):
+            handler = CANHandler(FakeCANConfig())
+        handler.set_sensor_data_callback(lambda data: handler.get_sensor_data())
+        ref = weakref.ref(handler)
+
+        del handler
+        gc.collect()
+
+        self.assertIsNone(ref())
+
+
+class CANSendCommandTests(unittest.TestCase):
+    def setUp(self):
+        with patch("communication.can_handler.CAN_AVAILABLE", False):
+            self.handler = CANHandler(FakeCANConfig())
+        self.handler.can_available = True
+        self.handler.can_bus = FakeBus()
+        self.fake_can = SimpleNamespace(Message=FakeMessage)
+
+    def test_sends_all_frames_with_reused_message(self):
+        with patch("communication.can_handler.can", self.fake_can, create=True):
+            self.assertTrue(self.handler.send_command("status_request"))
+            template = self.handler._tx_message
+            self.assertTrue(self.handler.send_command("restart"))
+
+        self.assertIs(self.handler._tx_message, template)
+        expected = (
+            self.handler.protocol.encode_message({"cmd": "status_request"})
+            + self.handler.protocol.encode_message({"cmd": "restart"})
+        )
+        self.assertEqual(
+            self.handler.can_bus.sent,
+            [(0x200, frame, 8) for frame in expected],
+        )
+
+    def test_standard_commands_reuse_precomputed_frames(self):
+        with patch("communication.can_handler.can", self.fake_can, create=True), \
+                patch.object(self.handler.protocol, "encode_message") as encode:
+            self.assertTrue(self.handler.request_sensor_status())
+            self.assertTrue(self.handler.restart_sensor_hub())
+
+        encode.assert_not_called()
+        self.assertEqual(len(self.handler.can_bus.sent), sum(
+            len(frames) for frames in self.handler._command_frames.values()
+        ))
+
+    def test_sends_without_pauses_by_default(self):
+        with patch("communication.can_handler.can", self.fake_can, create=True), \
+                patch("communication.can_handler.time.sleep") as sleep:
+            self.assertTrue(self.handler.send_command("status_request"))
+
+        sleep.assert_not_called()
+
+    def test_pauses_between_frame_batches(self):
+        self.handler.tx_batch_size = 2
+        self.handler.tx_batch_delay = 0.01
+        frames = self.handler.protocol.encode_message({"cmd": "status_request"})
+        with patch("communication.can_handler.can", self.fake_can, create=True), \
+                patch("communication.can_handler.time.sleep") as sleep:
+            self.handler.send_command("status_request")
+
+        self.assertEqual(sleep.call_count, (len(frames) - 1) // 2)
+
+
 if __name__ == "__main__":
     unittest.main()
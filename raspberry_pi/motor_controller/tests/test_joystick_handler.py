@@ -0,0 +1,68 @@
+import unittest
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from motor_controller.control.joystick_handler import JoystickHandler
+
+
+class FakeMotor:
+    def __init__(self):
+        self.commands = []
+        self.emergency_stops = 0
+
+    def set_joystick(self, x, y, use_ramping=True):
+        self.commands.append((x, y, use_ramping))
+
+    def emergency_stop(self):
+        self.emergency_stops += 1
+
+
+class FakeSafety:
+    def __init__(self, allowed=True):
+        self.allowed = allowed
+        self.joystick_updates = 0
+
+    def update_joystick_time(self):
+        self.joystick_updates += 1
+
+    def is_motion_allowed(self):
+        return self.allowed
+
+
+class JoystickHandlerTests(unittest.TestCase):
+    def setUp(self):
+        self.motor = FakeMotor()
+        self.safety = FakeSafety()
+        self.handler = JoystickHandler(self.motor, self.safety)
+
+    def test_update_clamps_and_forwards_position(self):
+        self.assertTrue(self.handler.update(1.5, -0.25))
+
+        self.assertEqual(self.handler.get_position(), (1.0, -0.25))
+        self.assertTrue(self.handler.is_enabled())
+        self.assertEqual(self.motor.commands, [(1.0, -0.25, False)])
+        self.assertEqual(self.safety.joystick_updates, 1)
+
+    def test_disable_keeps_max_speed(self):
+        self.handler.set_max_speed(40.0)
+        self.handler.update(0.5, 0.5)
+        self.handler.disable()
+
+        status = self.handler.get_status()
+        self.assertFalse(status['enabled'])
+        self.assertEqual((status['x'], status['y']), (0.0, 0.0))
+        self.assertEqual(status['max_speed'], 40.0)
+        self.assertEqual(self.motor.emergency_stops, 1)
+
+    def test_update_rejected_while_safety_stop_latched(self):
+        self.safety.allowed = False
+
+        self.assertFalse(self.handler.update(0.5, 0.5))
+        self.assertFalse(self.handler.is_enabled())
+        self.assertEqual(self.motor.commands, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,80 @@
+import importlib.util
+import time
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+try:
+    import can
+except ImportError:
+    can = None
+
+LEGACY_PATH = Path(__file__).resolve().parents[2] / "motor_controller.py"
+
+
+def _load_legacy_module():
+    spec = importlib.util.spec_from_file_location("legacy_motor_controller", LEGACY_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+if can is not None:
+    class FakeBus(can.BusABC):
+        """Bus, dessen recv() zuerst fehlschlägt und danach Frames liefert"""
+
+        def __init__(self, channel=None, fail=False, frames=(), **kwargs):
+            super().__init__(channel=channel, **kwargs)
+            self.fail = fail
+            self.frames = list(frames)
+            self.closed = False
+
+        def _recv_internal(self, timeout):
+            if self.fail:
+                raise can.CanOperationError("Network is down")
+            if self.frames:
+                return self.frames.pop(0), False
+            time.sleep(min(timeout or 0.01, 0.01))
+            return None, False
+
+        def send(self, msg, timeout=None):
+            pass
+
+        def shutdown(self):
+            self.closed = True
+            super().shutdown()
+
+
+@unittest.skipIf(can is None, "python-can nicht installiert")
+class LegacyNotifierRecoveryTests(unittest.TestCase):
+    @staticmethod
+    def _shutdown(controller):
+        if controller.can_notifier:
+            controller.can_notifier.stop()
+        if controller.can_bus:
+            controller.can_bus.shutdown()
+
+    def test_recv_error_rebuilds_bus_and_notifier(self):
+        legacy = _load_legacy_module()
+        frame = can.Message(arbitration_id=0x100, data=b"\x00\x01[1,2]", is_extended_id=False)
+        buses = [FakeBus(fail=True), FakeBus(frames=[frame])]
+
+        with patch.object(legacy.can.interface, "Bus", side_effect=lambda **kw: buses.pop(0)):
+            controller = legacy.MotorController(
+                light_enabled=False, mower_enabled=False, quiet=True
+            )
+            first_bus = controller.can_bus
+            self.addCleanup(self._shutdown, controller)
+
+            deadline = time.monotonic() + 3.0
+            while time.monotonic() < deadline and controller.sensor_data != [1, 2]:
+                time.sleep(0.02)
+
+        self.assertEqual(controller.sensor_data, [1, 2])
+        self.assertTrue(first_bus.closed)
+        self.assertIsNot(controller.can_bus, first_bus)
+        self.assertEqual(controller._can_error_count, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
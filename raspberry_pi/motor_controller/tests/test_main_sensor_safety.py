@@ -1,6 +1,7 @@
 import unittest
 from pathlib import Path
 import sys
+import threading
 import time
 from types import SimpleNamespace
 
@@ -154,5 +155,24 @@ class SensorSafetyScopeTests(unittest.TestCase):
         self.assertIn('Limit 8.0s', reason)
 
 
+class RunLoopTests(unittest.TestCase):
+    def test_run_blocks_until_shutdown_event(self):
+        app = MotorControllerApp.__new__(MotorControllerApp)
+        app.running = True
+        app.odrive_mower = None
+        app._shutdown_event = threading.Event()
+        shutdown_calls = []
+        app.shutdown = lambda: shutdown_calls.append(True)
+
+        timer = threading.Timer(0.05, app._shutdown_event.set)
+        timer.start()
+        self.addCleanup(timer.cancel)
+        start = time.monotonic()
+        app.run()
+
+        self.assertLess(time.monotonic() - start, 1.0)
+        self.assertEqual(shutdown_calls, [True])
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,150 @@
+import threading
+import time
+import unittest
+from pathlib import Path
+import sys
+from types import SimpleNamespace
+from unittest.mock import patch
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from motor_controller.config import PWMConfig, RampingConfig
+from motor_controller.control.motor_control import MotorControl
+
+
+class FakePWM:
+    def __init__(self):
+        self.calls = []
+        self.forced = []
+
+    def set_motor_pwm_both(self, left, right, force=False):
+        self.calls.append((left, right))
+        self.forced.append(force)
+        return True
+
+
+class EmergencyStopDuringRampPWM(FakePWM):
+    """Löst beim ersten Ramping-Schritt aus einem zweiten Thread einen Notaus aus"""
+
+    def __init__(self):
+        super().__init__()
+        self.motor = None
+        self.triggered = False
+
+    def set_motor_pwm_both(self, left, right, force=False):
+        if not self.triggered and (left, right) != (1500, 1500):
+            self.triggered = True
+            stopper = threading.Thread(target=self.motor.emergency_stop)
+            stopper.start()
+            # Ohne Lock läuft der Notaus hier komplett durch und der veraltete
+            # Ramping-Wert landet danach an der Hardware
+            stopper.join(0.2)
+        return super().set_motor_pwm_both(left, right, force)
+
+
+class MotorControlTests(unittest.TestCase):
+    def _make(self, ramping):
+        self.pwm = FakePWM()
+        config = SimpleNamespace(
+            pwm=PWMConfig(enabled=True),
+            ramping=RampingConfig(
+                enabled=ramping, acceleration_rate=2000, update_interval=0.005
+            ),
+        )
+        motor = MotorControl(self.pwm, config)
+        self.addCleanup(motor.cleanup)
+        return motor
+
+    def test_direct_control_sets_current_and_target(self):
+        motor = self._make(ramping=False)
+
+        motor.set_joystick(0.0, 1.0)
+
+        self.assertEqual(self.pwm.calls, [(2000, 2000)])
+        self.assertEqual(motor.get_current_values(), {'left': 2000, 'right': 2000})
+        self.assertEqual(motor.get_target_values(), {'left': 2000, 'right': 2000})
+        self.assertEqual(motor.get_current_pair(), (2000, 2000))
+        self.assertEqual(motor.get_status()['target_values'], {'left': 2000, 'right': 2000})
+
+    def test_ramping_converges_to_target(self):
+        motor = self._make(ramping=True)
+
+        motor.set_motor_target(1600, 1400)
+        deadline = time.monotonic() + 2.0
+        while motor.get_current_values() != {'left': 1600, 'right': 1400}:
+            self.assertLess(time.monotonic(), deadline)
+            time.sleep(0.01)
+
+        self.assertEqual(self.pwm.calls[-1], (1600, 1400))
+        self.assertGreater(len(self.pwm.calls), 2)
+
+    def test_skid_steering_mixes_and_clamps(self):
+        motor = self._make(ramping=False)
+
+        self.assertEqual(motor.calculate_skid_steering(0.0, 0.0), (1500, 1500))
+        self.assertEqual(motor.calculate_skid_steering(0.0, 0.5), (1750, 1750))
+        self.assertEqual(motor.calculate_skid_steering(0.5, 0.0), (1650, 1350))
+        self.assertEqual(motor.calculate_skid_steering(1.0, 1.0), (2000, 1700))
+        self.assertEqual(motor.calculate_skid_steering(1.0, -1.0), (1300, 1000))
+
+    def test_ramp_value_selects_rate_by_direction(self):
+        ramp = MotorControl._ramp_value
+
+        self.assertEqual(ramp(1500, 1700, 1500, 10, 20, 30), 1510)  # beschleunigen
+        self.assertEqual(ramp(1700, 1600, 1500, 10, 20, 30), 1680)  # verzögern
+        self.assertEqual(ramp(1400, 1500, 1500, 10, 20, 30), 1430)  # bremsen
+        self.assertEqual(ramp(1505, 1500, 1500, 10, 20, 30), 1500)  # nicht überschießen
+
+    def test_emergency_stop_forces_write_when_already_neutral(self):
+        motor = self._make(ramping=False)
+
+        motor.emergency_stop()
+
+        self.assertEqual(self.pwm.calls, [(1500, 1500)])
+        self.assertEqual(self.pwm.forced, [True])
+
+    def test_emergency_stop_overrides_ramp(self):
+        motor = self._make(ramping=True)
+
+        motor.set_motor_target(2000, 2000)
+        time.sleep(0.02)
+        motor.emergency_stop()
+        time.sleep(0.05)
+
+        self.assertEqual(motor.get_current_values(), {'left': 1500, 'right': 1500})
+        self.assertEqual(self.pwm.calls[-1], (1500, 1500))
+
+    def test_emergency_stop_is_not_overwritten_by_stale_ramp_step(self):
+        motor = self._make(ramping=True)
+        pwm = EmergencyStopDuringRampPWM()
+        pwm.motor = motor
+        motor.pwm = pwm
+
+        motor.set_motor_target(2000, 2000)
+        for _ in range(100):
+            if pwm.calls and pwm.calls[-1] == (1500, 1500):
+                break
+            time.sleep(0.01)
+        time.sleep(0.05)
+
+        self.assertTrue(pwm.triggered)
+        self.assertEqual(pwm.calls[-1], (1500, 1500))
+        self.assertEqual(motor.get_current_pair(), (1500, 1500))
+        self.assertEqual(motor.get_target_pair(), (1500, 1500))
+
+    def test_ramping_scheduling_is_opt_in_and_non_fatal(self):
+        motor = self._make(ramping=False)
+        target = "motor_controller.control.motor_control.os.sched_setscheduler"
+
+        with patch(target, create=True) as scheduler:
+            motor._apply_ramping_scheduling()
+        scheduler.assert_not_called()
+
+        motor.ramping_config.rt_priority = 50
+        with patch(target, side_effect=PermissionError("no CAP_SYS_NICE"), create=True) as scheduler:
+            motor._apply_ramping_scheduling()
+        scheduler.assert_called_once()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -313,11 +313,11 @@ class SafetyLatchTests(unittest.TestCase):
         self.assertTrue(self.monitor.is_motion_allowed())
 
     def test_command_timeout_only_runs_while_navigation_commands_are_active(self):
-        self.monitor.last_command_time = time.time() - 100.0
+        self.monitor.last_command_time_ns = time.monotonic_ns() - 101 * 10**9
         self.assertFalse(self.monitor.check_command_timeout())
 
         self.monitor.update_command_time()
-        self.monitor.last_command_time = time.time() - 100.0
+        self.monitor.last_command_time_ns = time.monotonic_ns() - 101 * 10**9
         self.assertTrue(self.monitor.check_command_timeout())
 
         self.monitor.deactivate_command_watchdog()
@@ -361,5 +361,33 @@ class SafetyLatchTests(unittest.TestCase):
         self.monitor.clear_motion_hold()
         self.assertEqual(resumes, [])
 
+    def test_safety_switch_callback_is_debounced(self):
+        reasons = []
+        self.monitor.set_system_stop_callback(reasons.append)
+
+        self.monitor._safety_callback(17)
+        self.monitor.reset_system_stop()
+        self.monitor._safety_callback(17)
+
+        self.assertEqual(reasons, ["Sicherheitsschalter ausgeloest"])
+        self.assertTrue(self.monitor.is_motion_allowed())
+
+    def test_watchdog_wakes_for_new_command_deadline(self):
+        self.monitor = SafetyMonitor(FakeSafetyConfig(command_timeout=0.05), SimpleNamespace())
+        self.monitor.config.enabled = True
+        stopped = threading.Event()
+        self.monitor.set_emergency_stop_callback(stopped.set)
+        self.monitor.start_watchdog()
+
+        # Idle watchdog without CAN check sleeps until a deadline appears
+        self.assertIsNone(self.monitor._next_timeout_delay())
+        start = time.monotonic()
+        self.monitor.update_command_time()
+
+        self.assertTrue(stopped.wait(1.0))
+        self.assertGreaterEqual(time.monotonic() - start, 0.05)
+        self.monitor.stop_watchdog()
+        self.assertFalse(self.monitor.get_status()['command_active'])
+
 if __name__ == "__main__":
     unittest.main()
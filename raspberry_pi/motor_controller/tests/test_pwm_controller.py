@@ -0,0 +1,100 @@
+import unittest
+from pathlib import Path
+import sys
+from types import SimpleNamespace
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from motor_controller.config import MowerConfig, PWMConfig
+from motor_controller.hardware.pwm_controller import PWMController
+
+
+class FakePi:
+    def __init__(self):
+        self.calls = []
+
+    def hardware_PWM(self, pin, frequency, duty):
+        self.calls.append((pin, frequency, duty))
+
+
+class PWMControllerTests(unittest.TestCase):
+    def setUp(self):
+        self.pi = FakePi()
+        gpio = SimpleNamespace(get_pigpio=lambda: self.pi)
+        self.pwm = PWMController(PWMConfig(enabled=True), MowerConfig(enabled=False), gpio)
+        self.pi.calls.clear()
+
+    def test_set_both_writes_both_pins_with_integer_duty(self):
+        self.assertTrue(self.pwm.set_motor_pwm_both(1600, 1400))
+
+        self.assertEqual(self.pi.calls, [(19, 50, 80000), (18, 50, 70000)])
+        self.assertEqual(self.pwm.get_motor_pwm_both(), {'left': 1600, 'right': 1400})
+
+    def test_set_both_skips_unchanged_values(self):
+        self.pwm.set_motor_pwm_both(1600, 1400)
+        self.assertTrue(self.pwm.set_motor_pwm_both(1600, 1400))
+
+        self.assertEqual(self.pi.calls, [(19, 50, 80000), (18, 50, 70000)])
+
+    def test_neutral_always_writes_even_if_cached(self):
+        self.assertEqual(self.pwm.get_motor_pwm_both(), {'left': 1500, 'right': 1500})
+        self.assertTrue(self.pwm.set_motor_neutral())
+        self.assertTrue(self.pwm.set_motor_pwm_both(1500, 1500, force=True))
+
+        self.assertEqual(self.pi.calls, [
+            (19, 50, 75000), (18, 50, 75000),
+            (19, 50, 75000), (18, 50, 75000),
+        ])
+
+    def test_set_both_clamps_values(self):
+        self.pwm.set_motor_pwm_both(500, 2500)
+
+        self.assertEqual(self.pwm.get_motor_pwm_both(), {'left': 1000, 'right': 2000})
+
+    def test_set_both_reports_pigpio_failure(self):
+        def fail(pin, frequency, duty):
+            raise RuntimeError("pigpio daemon gone")
+        self.pi.hardware_PWM = fail
+
+        self.assertFalse(self.pwm.set_motor_pwm_both(1600, 1600))
+        self.assertEqual(self.pwm.get_motor_pwm_both(), {'left': 1500, 'right': 1500})
+
+    def test_set_single_side_uses_integer_duty(self):
+        self.assertTrue(self.pwm.set_motor_pwm('right', 1733))
+
+        self.assertEqual(self.pi.calls, [(18, 50, 86650)])
+
+
+class MowerPWMTests(unittest.TestCase):
+    def setUp(self):
+        self.pi = FakePi()
+        gpio = SimpleNamespace(get_pigpio=lambda: self.pi)
+        self.mower_config = MowerConfig(enabled=True)
+        self.pwm = PWMController(PWMConfig(enabled=False), self.mower_config, gpio)
+        self.pi.calls.clear()
+
+    def test_speed_maps_linearly_between_duty_limits(self):
+        cfg = self.mower_config
+        for speed in (1, 37, 50, 100):
+            self.pwm.set_mower_speed(speed)
+            expected = int((cfg.duty_min + (speed / 100.0) * (cfg.duty_max - cfg.duty_min)) * 10000)
+            self.assertEqual(self.pi.calls[-1], (cfg.pwm_pin, cfg.pwm_frequency, expected))
+
+    def test_zero_and_out_of_range_speeds(self):
+        self.pwm.set_mower_speed(0)
+        self.assertEqual(self.pi.calls[-1][2], self.mower_config.duty_off * 10000)
+
+        self.pwm.set_mower_speed(150)
+        self.assertEqual(self.pi.calls[-1][2], self.mower_config.duty_max * 10000)
+        self.assertEqual(self.pwm.get_mower_speed(), 100)
+
+    def test_fractional_speed_is_not_truncated(self):
+        cfg = self.mower_config
+        self.pwm.set_mower_speed(99.9)
+        expected = int((cfg.duty_min + 0.999 * (cfg.duty_max - cfg.duty_min)) * 10000)
+        self.assertEqual(self.pi.calls[-1][2], expected)
+        self.assertNotEqual(expected, self.pwm._mower_duty_table[99])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,64 @@
+import threading
+import time
+import unittest
+from pathlib import Path
+import sys
+from types import SimpleNamespace
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from motor_controller.web.web_server import WebServer
+
+
+class FakeJoystick:
+    def __init__(self):
+        self.updates = []
+        self.disable_calls = 0
+
+    def update(self, x, y):
+        self.updates.append((x, y))
+        return True
+
+    def disable(self):
+        self.disable_calls += 1
+
+    def get_status(self):
+        return {'enabled': bool(self.updates), 'max_speed': 100}
+
+
+class JoystickThrottleTests(unittest.TestCase):
+    def setUp(self):
+        config = SimpleNamespace(template_folder='.', static_folder='.', secret_key='test')
+        dummy = SimpleNamespace()
+        self.joystick = FakeJoystick()
+        self.server = WebServer(config, dummy, self.joystick, dummy, dummy)
+
+    def _run_joystick_loop(self):
+        self.server.running = True
+        thread = threading.Thread(target=self.server._joystick_loop, daemon=True)
+        thread.start()
+        self.addCleanup(thread.join, 2.0)
+        self.addCleanup(setattr, self.server, 'running', False)
+
+    def test_burst_applies_only_latest_position(self):
+        for i in range(10):
+            self.server._queue_joystick(0.0, i / 10)
+
+        self.assertEqual(self.joystick.updates, [])
+        self._run_joystick_loop()
+        time.sleep(0.1)
+
+        self.assertEqual(self.joystick.updates, [(0.0, 0.9)])
+
+    def test_release_discards_pending_position(self):
+        self.server._queue_joystick(0.5, 0.5)
+        self.server._release_joystick()
+        self._run_joystick_loop()
+        time.sleep(0.1)
+
+        self.assertEqual(self.joystick.updates, [])
+        self.assertEqual(self.joystick.disable_calls, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -73,6 +73,11 @@ class WebServer:
         self.can_enabled = bool(getattr(self.can, 'can_enabled', True))
         self.light_state = False
         self.mower_state = False
+        # Joystick-Drosselung: max. 50 Hz, jeweils nur die letzte Position
+        self._joystick_interval = 0.02
+        self._joystick_lock = threading.Lock()
+        self._joystick_event = threading.Event()
+        self._pending_joystick = None
         self._plan_lock = threading.Lock()
         self._resume_lock = threading.Lock()
         self._simulation_lock = threading.Lock()
@@ -1340,7 +1345,7 @@ class WebServer:
 
     def _save_resume_state(self, reason='running'):
         with self._resume_lock:
-            now = time.time()
+            now = time.monotonic()
             if reason == 'running' and now - self._last_resume_save < 2.0:
                 return
             self._last_resume_save = now
@@ -1484,22 +1489,20 @@ class WebServer:
             """Client getrennt"""
             self.logger.info("🔌 WebSocket Client getrennt")
             # Joystick deaktivieren bei Disconnect
-            self.joystick.disable()
+            self._release_joystick()
 
         @self.socketio.on('joystick_update')
         def handle_joystick_update(data):
             """Joystick-Position Update"""
             x = data.get('x', 0.0)
             y = data.get('y', 0.0)
-            self.joystick.update(x, y)
-            # PWM-Werte zurücksenden
-            self._emit_pwm_update()
+            # PWM-Werte gehen mit dem 10-Hz-status_update an die Clients
+            self._queue_joystick(x, y)
 
         @self.socketio.on('joystick_release')
         def handle_joystick_release():
             """Joystick losgelassen"""
-            self.joystick.disable()
-            self._emit_pwm_update()
+            self._release_joystick()
 
         @self.socketio.on('max_speed_update')
         def handle_max_speed_update(data):
@@ -1508,6 +1511,34 @@ class WebServer:
             self.joystick.set_max_speed(max_speed)
             self.logger.info(f"Max Speed: {max_speed}%")
 
+    def _queue_joystick(self, x, y):
+        """Merkt Joystick-Position vor - _joystick_loop wendet die letzte an"""
+        with self._joystick_lock:
+            self._pending_joystick = (x, y)
+        self._joystick_event.set()
+
+    def _release_joystick(self):
+        """Verwirft vorgemerkte Joystick-Positionen und stoppt sofort (ungedrosselt)"""
+        with self._joystick_lock:
+            self._pending_joystick = None
+            self.joystick.disable()
+
+    def _joystick_loop(self):
+        """Wendet die jeweils letzte Joystick-Position mit max. 50 Hz an"""
+        while self.running:
+            if not self._joystick_event.wait(timeout=1.0):
+                continue
+            self._joystick_event.clear()
+            try:
+                with self._joystick_lock:
+                    position = self._pending_joystick
+                    self._pending_joystick = None
+                    if position is not None:
+                        self.joystick.update(*position)
+            except Exception as e:
+                self.logger.error(f"❌ Joystick-Update Fehler: {e}")
+            time.sleep(self._joystick_interval)
+
     def _mower_api_status(self, success=True, error=None):
         if self.odrive_mower and self.odrive_mower.enabled:
             status = self.odrive_mower.get_status(success=success, error=error)
@@ -1665,25 +1696,12 @@ class WebServer:
             'light_state': self.light_state,
             'light_enabled': self.light_config.enabled if self.light_config else False,
             **self._mower_api_status(),
-            'current_pwm': self.motor.get_status().get('current_pwm', {'left': 1500, 'right': 1500}),
+            'current_pwm': self.motor.get_current_values(),
             'max_speed_percent': self.joystick.get_status().get('max_speed', 100)
         }
 
         self.socketio.emit('status_update', status)
 
-    def _emit_pwm_update(self):
-        """Sendet PWM-Update an alle Clients"""
-        if not self.socketio:
-            return
-
-        motor_status = self.motor.get_status()
-        current_pwm = motor_status.get('current_pwm', {'left': 1500, 'right': 1500})
-
-        self.socketio.emit('pwm_update', {
-            'left': int(current_pwm['left']),
-            'right': int(current_pwm['right'])
-        })
-
     def start(self):
         """Startet Web-Server"""
         if not self.flask_available or not self.app:
@@ -1702,12 +1720,13 @@ class WebServer:
         if self.socketio:
             self.status_thread = threading.Thread(target=self._status_update_loop, daemon=True)
             self.status_thread.start()
+            self.joystick_thread = threading.Thread(target=self._joystick_loop, daemon=True)
+            self.joystick_thread.start()
 
         self.logger.info(f"✅ Web-Server gestartet auf {self.config.host}:{self.config.port}")
     
     def _status_update_loop(self):
         """Sendet regelmäßig Status-Updates (100ms)"""
-        import time
         while self.running:
             try:
                 self._emit_status_update()
@@ -130,7 +130,7 @@ class GPSHandler:
                 if line:
                     self._parse_nmea(line)
             except Exception as e:
-                logger.debug(f"GPS Read-Fehler: {e}")
+                logger.debug("GPS Read-Fehler: %s", e)
                 time.sleep(0.1)
     
     def _parse_nmea(self, sentence: str):
@@ -187,9 +187,9 @@ class GPSHandler:
         
         except pynmea2.ParseError:
             # Ignoriere Parse-Fehler (z.B. korrupte Sätze)
-            logger.debug(f"NMEA Parse-Fehler (ignoriert): {sentence[:50]}")
+            logger.debug("NMEA Parse-Fehler (ignoriert): %.50s", sentence)
         except Exception as e:
-            logger.debug(f"NMEA Verarbeitungsfehler: {e}")
+            logger.debug("NMEA Verarbeitungsfehler: %s", e)
     
     def write_data(self, data: bytes):
         """
@@ -199,7 +199,7 @@ class GPSHandler:
         if self.serial_port and self.serial_port.is_open:
             try:
                 self.serial_port.write(data)
-                logger.debug(f"📤 {len(data)} Bytes an GPS gesendet")
+                logger.debug("📤 %d Bytes an GPS gesendet", len(data))
             except Exception as e:
                 logger.warning(f"⚠️ Fehler beim Schreiben auf GPS-Port: {e}")
     
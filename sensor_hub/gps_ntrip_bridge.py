@@ -87,7 +87,7 @@ class GPSNTRIPBridge:
         try:
             # NTRIP-Daten an GPS-Gerät senden (über öffentliche Methode für Kapselung)
             self.gps.write_data(data)
-            logger.debug(f"📤 {len(data)} Bytes NTRIP-Daten an GPS gesendet")
+            logger.debug("📤 %d Bytes NTRIP-Daten an GPS gesendet", len(data))
         except Exception as e:
             logger.warning(f"⚠️  Fehler beim Senden von NTRIP-Daten: {e}")
     
@@ -95,6 +95,9 @@ class GPSNTRIPBridge:
         """Überwacht RTK-Status und Verbindungen"""
         while self.running:
             try:
+                # Monotone Uhr: Intervalle bleiben bei NTP-/GPS-Zeitsprüngen stabil
+                now = time.monotonic()
+
                 # NTRIP Reconnect wenn nötig
                 self.ntrip.reconnect_if_needed()
 
@@ -110,14 +113,13 @@ class GPSNTRIPBridge:
                 # RTK-Uptime berechnen
                 if current_rtk_status == "RTK FIXED":
                     if self.rtk_fix_time is None:
-                        self.rtk_fix_time = time.time()
-                    self.rtk_uptime = time.time() - self.rtk_fix_time
+                        self.rtk_fix_time = now
+                    self.rtk_uptime = now - self.rtk_fix_time
                 else:
                     self.rtk_fix_time = None
                     self.rtk_uptime = 0
 
                 # GPGGA periodisch an NTRIP senden (für VRS - Virtuelle Referenzstation)
-                now = time.time()
                 if self.ntrip.is_connected() and now - self.last_gga_send_time > self.gga_send_interval:
                     raw_gga = self.gps.get_last_raw_gga()
                     if raw_gga:
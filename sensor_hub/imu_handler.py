@@ -15,6 +15,9 @@ except ImportError:  # pragma: no cover - optional in tests
 
 logger = logging.getLogger(__name__)
 
+# Vier little-endian int16 Nutzwerte ab Byte 2 eines WitMotion-Frames
+_FRAME_VALUES = struct.Struct('<hhhh')
+
 
 def _normalize_heading(angle: float) -> float:
     """Normalisiert Winkel in den Bereich 0-360°."""
@@ -106,7 +109,7 @@ class WitMotionUSBIMU:
                 self._process_bytes(chunk)
             except Exception as e:
                 if self.running:
-                    logger.debug(f"⚠️  WitMotion Read Fehler: {e}")
+                    logger.debug("⚠️  WitMotion Read Fehler: %s", e)
                 time.sleep(0.1)
 
     def _process_bytes(self, data: bytes):
@@ -115,27 +118,43 @@ class WitMotionUSBIMU:
             return
 
         with self.lock:
-            self._rx_buffer.extend(data)
-
-            while len(self._rx_buffer) >= self.FRAME_SIZE:
-                if self._rx_buffer[0] != self.FRAME_HEADER:
-                    del self._rx_buffer[0]
+            buffer = self._rx_buffer
+            buffer.extend(data)
+
+            # Über einen Offset parsen und den verbrauchten Präfix einmalig am
+            # Ende löschen, statt den Rest des Puffers pro Frame zu verschieben.
+            offset = 0
+            end = len(buffer) - self.FRAME_SIZE
+            while offset <= end:
+                if buffer[offset] != self.FRAME_HEADER:
+                    # Müll bis zum nächsten Header in C überspringen
+                    offset = buffer.find(self.FRAME_HEADER, offset + 1)
+                    if offset == -1:
+                        offset = len(buffer)
                     continue
 
-                frame = bytes(self._rx_buffer[:self.FRAME_SIZE])
-                del self._rx_buffer[:self.FRAME_SIZE]
+                frame = bytes(buffer[offset:offset + self.FRAME_SIZE])
 
                 checksum = sum(frame[:10]) & 0xFF
                 if checksum != frame[10]:
+                    # Nur das vermeintliche Header-Byte verwerfen: ein 0x55 in den
+                    # Nutzdaten darf den nächsten echten Frame nicht mitreißen.
                     logger.debug("⚠️  WitMotion Checksum-Fehler verworfen")
+                    offset = buffer.find(self.FRAME_HEADER, offset + 1)
+                    if offset == -1:
+                        offset = len(buffer)
                     continue
 
+                offset += self.FRAME_SIZE
                 self._process_frame_locked(frame)
 
+            if offset:
+                del buffer[:offset]
+
     def _process_frame_locked(self, frame: bytes):
         """Aktualisiert die zuletzt empfangenen Sensorwerte."""
         frame_type = frame[1]
-        d1, d2, d3, d4 = struct.unpack('<hhhh', frame[2:10])
+        d1, d2, d3, d4 = _FRAME_VALUES.unpack_from(frame, 2)
 
         self.last_packet_time = time.time()
         self._frames_seen.add(frame_type)
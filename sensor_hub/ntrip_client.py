@@ -3,11 +3,13 @@ NTRIP Client für RTK-Korrekturdaten
 Verbindet mit NTRIP-Server und sendet Korrekturdaten an GPS-Gerät
 """
 
+import selectors
 import socket
 import threading
 import time
 import logging
 import base64
+import random
 from typing import Optional
 
 logger = logging.getLogger(__name__)
@@ -15,10 +17,13 @@ logger = logging.getLogger(__name__)
 
 class NTRIPClient:
     """NTRIP Client für RTK-Korrekturdaten"""
+
+    # Obergrenze für den HTTP-Antwort-Header (Schutz vor endlosem Lesen)
+    MAX_HEADER_SIZE = 8192
     
     def __init__(self, host: str, port: int, mountpoint: str, 
                  username: str, password: str, timeout: float = 10.0,
-                 reconnect_interval: float = 30.0):
+                 reconnect_interval: float = 30.0, reconnect_base_delay: float = 1.0):
         """
         Initialisiert NTRIP Client
         
@@ -29,7 +34,8 @@ class NTRIPClient:
             username: Benutzername
             password: Passwort
             timeout: Verbindungs-Timeout
-            reconnect_interval: Reconnect-Versuch nach X Sekunden
+            reconnect_interval: Maximale Wartezeit zwischen Reconnect-Versuchen (Sekunden)
+            reconnect_base_delay: Erste Wartezeit nach einem Fehlversuch (Sekunden)
         """
         self.host = host
         self.port = port
@@ -38,12 +44,14 @@ class NTRIPClient:
         self.password = password
         self.timeout = timeout
         self.reconnect_interval = reconnect_interval
+        self.reconnect_base_delay = reconnect_base_delay
         
         self.socket = None
         self.running = False
         self.connected = False
         self.reader_thread = None
         self.last_connection_attempt = 0
+        self.next_connection_attempt = 0.0
         self.connection_attempts = 0
         self.bytes_received = 0
         self.last_data_time = 0
@@ -51,6 +59,16 @@ class NTRIPClient:
         # Callback für empfangene Daten
         self.on_data_received = None
 
+        # NTRIP Request ist pro Verbindung identisch - einmal vorbauen
+        auth_string = base64.b64encode(f"{self.username}:{self.password}".encode()).decode()
+        self._request_bytes = (
+            f"GET /{self.mountpoint} HTTP/1.0\r\n"
+            f"User-Agent: NTRIP Quassel-UGV/1.0\r\n"
+            f"Authorization: Basic {auth_string}\r\n"
+            f"Connection: close\r\n"
+            f"\r\n"
+        ).encode()
+
     def enable(self):
         """Aktiviert den Client für Verbindungsversuche"""
         self.running = True
@@ -69,27 +87,25 @@ class NTRIPClient:
             self.socket.connect((self.host, self.port))
             
             # NTRIP Request senden
-            auth_string = base64.b64encode(f"{self.username}:{self.password}".encode()).decode()
-            request = (
-                f"GET /{self.mountpoint} HTTP/1.0\r\n"
-                f"User-Agent: NTRIP Quassel-UGV/1.0\r\n"
-                f"Authorization: Basic {auth_string}\r\n"
-                f"Connection: close\r\n"
-                f"\r\n"
-            )
-            
-            self.socket.sendall(request.encode())
+            self.socket.sendall(self._request_bytes)
             logger.debug(f"📤 NTRIP Request gesendet")
             
             # Response lesen (HTTP Header)
-            response = b""
-            while b"\r\n\r\n" not in response:
-                chunk = self.socket.recv(1024)
-                if not chunk:
+            # bytearray wächst in-place; Header-Ende nur im neuen Teil suchen
+            response = bytearray()
+            recv_buffer = memoryview(bytearray(1024))
+            header_end = -1
+            while header_end == -1:
+                if len(response) > self.MAX_HEADER_SIZE:
+                    raise Exception("NTRIP Header zu groß")
+                received = self.socket.recv_into(recv_buffer)
+                if not received:
                     raise Exception("Server hat Verbindung geschlossen")
-                response += chunk
-            
-            response_str = response.decode('utf-8', errors='ignore')
+                search_start = max(0, len(response) - 3)
+                response += recv_buffer[:received]
+                header_end = response.find(b"\r\n\r\n", search_start)
+
+            response_str = response[:header_end].decode('utf-8', errors='ignore')
             
             # HTTP Status überprüfen
             if "200" in response_str:
@@ -97,6 +113,15 @@ class NTRIPClient:
                 self.connected = True
                 self.connection_attempts = 0
                 self.running = True
+
+                # Korrekturdaten, die im selben Segment wie der Header kamen,
+                # nicht verwerfen, sondern vor dem Reader-Thread weiterreichen
+                initial_data = bytes(response[header_end + 4:])
+                if initial_data:
+                    self.bytes_received += len(initial_data)
+                    self.last_data_time = time.time()
+                    if self.on_data_received:
+                        self.on_data_received(initial_data)
                 
                 # Reader-Thread starten
                 self.reader_thread = threading.Thread(target=self._read_loop, daemon=True)
@@ -141,29 +166,35 @@ class NTRIPClient:
     
     def _read_loop(self):
         """Liest kontinuierlich NTRIP-Daten"""
-        while self.running and self.connected:
-            try:
+        # Auf Lesbarkeit warten statt in recv() bis zum Socket-Timeout zu
+        # blockieren: so bemerkt der Thread disconnect() spätestens nach
+        # einer Sekunde und wacht ansonsten nur bei neuen Daten auf.
+        selector = selectors.DefaultSelector()
+        try:
+            selector.register(self.socket, selectors.EVENT_READ)
+            while self.running and self.connected:
+                if not selector.select(timeout=1.0):
+                    continue
+
                 data = self.socket.recv(4096)
-                
+
                 if not data:
                     logger.warning("⚠️  NTRIP Server hat Verbindung geschlossen")
                     self.connected = False
                     break
-                
+
                 self.bytes_received += len(data)
                 self.last_data_time = time.time()
-                
+
                 # Callback aufrufen wenn registriert
                 if self.on_data_received:
                     self.on_data_received(data)
-            
-            except socket.timeout:
-                # Timeout ist ok, einfach weitermachen
-                pass
-            except Exception as e:
-                logger.warning(f"⚠️  NTRIP Read-Fehler: {e}")
-                self.connected = False
-                break
+
+        except Exception as e:
+            logger.warning(f"⚠️  NTRIP Read-Fehler: {e}")
+            self.connected = False
+        finally:
+            selector.close()
     
     def is_connected(self) -> bool:
         """Gibt Verbindungsstatus zurück"""
@@ -193,18 +224,32 @@ class NTRIPClient:
             try:
                 # GGA-Satz mit CRLF senden
                 self.socket.sendall(gga_sentence.encode('ascii') + b'\r\n')
-                logger.debug(f"📤 GPGGA an NTRIP gesendet: {gga_sentence[:50]}...")
+                logger.debug("📤 GPGGA an NTRIP gesendet: %.50s...", gga_sentence)
             except Exception as e:
                 logger.warning(f"⚠️ Fehler beim Senden von GPGGA: {e}")
 
+    def _next_reconnect_delay(self) -> float:
+        """
+        Berechnet die Wartezeit bis zum nächsten Reconnect-Versuch
+
+        Exponentielles Backoff ab reconnect_base_delay, begrenzt auf
+        reconnect_interval, mit ±50% Jitter.
+
+        Returns:
+            Wartezeit in Sekunden
+        """
+        exponent = min(max(self.connection_attempts - 1, 0), 16)
+        delay = min(self.reconnect_interval, self.reconnect_base_delay * (2 ** exponent))
+        return delay * random.uniform(0.5, 1.5)
+
     def reconnect_if_needed(self):
         """Versucht zu reconnecten wenn nötig"""
         if not self.connected and self.running:
-            now = time.time()
+            now = time.monotonic()
             # Beim ersten Versuch (connection_attempts == 0) sofort verbinden
-            if self.connection_attempts == 0 or (now - self.last_connection_attempt > self.reconnect_interval):
+            if self.connection_attempts == 0 or now >= self.next_connection_attempt:
                 self.connection_attempts += 1
                 self.last_connection_attempt = now
                 logger.info(f"🔄 NTRIP Reconnect-Versuch #{self.connection_attempts}")
-                self.connect()
-
+                if not self.connect():
+                    self.next_connection_attempt = time.monotonic() + self._next_reconnect_delay()
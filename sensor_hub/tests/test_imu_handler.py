@@ -74,6 +74,25 @@ class WitMotionHandlerTests(unittest.TestCase):
         self.assertFalse(imu.get_data()['is_calibrated'])
         self.assertEqual(imu.get_orientation()['yaw'], 0.0)
 
+    def test_resyncs_on_valid_frame_after_false_header(self):
+        imu = WitMotionUSBIMU(port='COM_TEST', baudrate=9600)
+        stream = bytes([0x55, 0x53, 0x00]) + build_frame(0x53, [8192, 0, 0, 0])
+
+        imu._process_bytes(stream)
+
+        self.assertAlmostEqual(imu.get_orientation()['roll'], 45.0, places=2)
+
+    def test_frame_split_across_reads_is_reassembled(self):
+        imu = WitMotionUSBIMU(port='COM_TEST', baudrate=9600)
+        stream = build_frame(0x51, [2048, 0, 0, 2500]) + build_frame(0x53, [8192, 0, 0, 0])
+
+        imu._process_bytes(stream[:15])
+        imu._process_bytes(stream[15:])
+
+        self.assertAlmostEqual(imu.get_data()['accel']['x'], 9.81, places=2)
+        self.assertAlmostEqual(imu.get_orientation()['roll'], 45.0, places=2)
+        self.assertEqual(len(imu._rx_buffer), 0)
+
     def test_create_imu_handler_returns_witmotion_handler(self):
         imu = create_imu_handler('witmotion', port='COM_TEST', baudrate=9600)
         self.assertIsInstance(imu, WitMotionUSBIMU)
@@ -0,0 +1,91 @@
+import sys
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from ntrip_client import NTRIPClient
+
+
+def build_client(**kwargs):
+    return NTRIPClient('caster.example', 2101, 'MOUNT', 'user', 'pass', **kwargs)
+
+
+class NTRIPReconnectBackoffTests(unittest.TestCase):
+    def test_delay_doubles_and_is_capped_by_reconnect_interval(self):
+        client = build_client(reconnect_interval=30.0, reconnect_base_delay=1.0)
+        delays = []
+        with mock.patch('ntrip_client.random.uniform', return_value=1.0):
+            for attempts in range(1, 8):
+                client.connection_attempts = attempts
+                delays.append(client._next_reconnect_delay())
+
+        self.assertEqual(delays, [1.0, 2.0, 4.0, 8.0, 16.0, 30.0, 30.0])
+
+    def test_failed_attempt_schedules_next_try(self):
+        client = build_client(reconnect_base_delay=2.0)
+        client.running = True
+
+        with mock.patch.object(client, 'connect', return_value=False) as connect, \
+                mock.patch('ntrip_client.random.uniform', return_value=1.0):
+            client.reconnect_if_needed()
+            client.reconnect_if_needed()
+
+        self.assertEqual(connect.call_count, 1)
+        self.assertEqual(client.connection_attempts, 1)
+        self.assertAlmostEqual(client.next_connection_attempt - client.last_connection_attempt, 2.0, delta=0.5)
+
+
+class FakeSocket:
+    def __init__(self, chunks):
+        self.chunks = list(chunks)
+        self.sent = b''
+
+    def settimeout(self, timeout):
+        pass
+
+    def connect(self, address):
+        pass
+
+    def sendall(self, data):
+        self.sent += data
+
+    def recv_into(self, buffer):
+        if not self.chunks:
+            return 0
+        chunk = self.chunks.pop(0)
+        buffer[:len(chunk)] = chunk
+        return len(chunk)
+
+    def close(self):
+        pass
+
+
+class NTRIPConnectTests(unittest.TestCase):
+    def test_header_split_across_reads_keeps_trailing_correction_data(self):
+        client = build_client()
+        received = []
+        client.on_data_received = received.append
+        fake_socket = FakeSocket([b'ICY 200 OK\r', b'\n\r\n\xd3\x00\x13'])
+
+        with mock.patch('ntrip_client.socket.socket', return_value=fake_socket), \
+                mock.patch.object(client, '_read_loop'):
+            self.assertTrue(client.connect())
+
+        self.assertTrue(fake_socket.sent.startswith(b'GET /MOUNT HTTP/1.0\r\n'))
+        self.assertEqual(received, [b'\xd3\x00\x13'])
+        self.assertEqual(client.bytes_received, 3)
+
+    def test_error_status_is_rejected(self):
+        client = build_client()
+        fake_socket = FakeSocket([b'HTTP/1.0 401 Unauthorized\r\n\r\n'])
+
+        with mock.patch('ntrip_client.socket.socket', return_value=fake_socket):
+            self.assertFalse(client.connect())
+
+        self.assertFalse(client.connected)
+
+
+if __name__ == '__main__':
+    unittest.main()